@@ -1,12 +1,14 @@
 import tkinter as tk
 import datetime
 import threading
+import queue
+import traceback
 from tkinter import ttk, messagebox
 from theme import BG_MAIN, BG_PANEL, BLUE_BG, RED_BG, init_styles
 from views.timeseries_view import TimeseriesView
 from views.models_view import ModelsView
 from dialogs.add_timeseries import AddTimeseriesDialog
-from state import load_state, save_state
+from state import load_state, save_state, flush_state
 from dialogs.model_form import AddOrEditModelDialog
 from views.forecasts_view import ForecastsView
 from dialogs.forecast_form import AddForecastDialog
@@ -19,9 +21,6 @@ from dialogs.brutus_form import BrutusDialog
 
 from src.timeseries import Timeseries
 from src.forecast import Forecast
-from modules.timeseries_builder import build_timeseries
-from modules.prophet_multivar import forecast_with_regressors
-from modules.forecast_renderer import render_from_json
 
 APP_W, APP_H = 1280, 720
 
@@ -36,14 +35,70 @@ class App(tk.Tk):
         init_styles()  # спільні стилі ttk
 
         self._booting = True
+        self._prophet_warm = False
+        self._save_after_id = None
+        self._add_ts_dialog = None
+        # назви рядів і параметрів для форм; скидаються, коли змінюється список рядів
+        self._entries_memo = None
+        self._params_memo = None
+        # завершення фонових задач: воркери кладуть сюди колбеки,
+        # головний потік розбирає їх пачкою раз на 50 мс
+        self._completions = queue.Queue()
+        # довгі задачі (побудова рядів, прогнози, рендер) стають у чергу,
+        # а не запускаються всі одночасно; потоки-демони не тримають процес після закриття вікна
+        self._jobs = queue.Queue()
+        for i in range(2):
+            threading.Thread(target=self._job_loop, name=f"wqp-{i}", daemon=True).start()
         self._build_menubar()
         self._build_shell()
         self._build_views()
+        self.show_view("timeseries")
 
-        self._load_state()
-        self._booting = False 
+        # списки з диска підвантажуються вже після появи вікна
+        self.after_idle(self._finish_boot)
+        self.after(50, self._pump_completions)
 
-        self.show_view("timeseries")
+    def _job_loop(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            except Exception:
+                traceback.print_exc()
+
+    def _pump_completions(self):
+        try:
+            while True:
+                try:
+                    callback = self._completions.get_nowait()
+                except queue.Empty:
+                    break
+                callback()
+        finally:
+            self.after(50, self._pump_completions)
+
+    def _warmup_prophet(self):
+        # імпорт prophet/pandas повільний — підтягуємо його у фоні, коли вперше
+        # відкривається форма прогнозу чи Brutus, поки користувач її заповнює
+        if self._prophet_warm:
+            return
+        self._prophet_warm = True
+
+        def imports():
+            try:
+                import pandas
+                import prophet
+            except Exception:
+                # прогрів необов'язковий: справжній прогноз сам покаже помилку
+                pass
+
+        threading.Thread(target=imports, daemon=True).start()
+
+    def _finish_boot(self):
+        self._load_state()
+        self._booting = False
+        # вікно додавання ряду готуємо наперед (приховане), щоб відкривалось миттєво
+        self._add_ts_dialog = AddTimeseriesDialog(self)
 
     # ---------- Menu ----------
     def _build_menubar(self):
@@ -65,28 +120,21 @@ class App(tk.Tk):
         self.left.pack(side="left", fill="y")
         self.left.pack_propagate(False)
 
-        self.btn_ts = tk.Button(self.left, text="Часові ряди", bg=BLUE_BG, activebackground=BLUE_BG,
-                                relief="groove", bd=2, padx=14, pady=10,
-                                command=lambda: self.show_view("timeseries"))
+        # кнопки навігації: вигляд задає спільний стиль Nav.TButton
+        self.btn_ts = ttk.Button(self.left, text="Часові ряди", style="Nav.TButton",
+                                 command=lambda: self.show_view("timeseries"))
         self.btn_ts.pack(padx=16, pady=(16,8), anchor="n", fill="x")
 
-        self.btn_models = tk.Button(
-            self.left, text="Моделі", bg=BLUE_BG, activebackground=BLUE_BG,
-            relief="groove", bd=2, padx=14, pady=10,
-            command=lambda: self.show_view("models")
-        )
+        self.btn_models = ttk.Button(self.left, text="Моделі", style="Nav.TButton",
+                                     command=lambda: self.show_view("models"))
         self.btn_models.pack(padx=16, pady=8, anchor="n", fill="x")
 
-        self.btn_forecasts = tk.Button(
-            self.left, text="Передбачення", bg=BLUE_BG, activebackground=BLUE_BG,
-            relief="groove", bd=2, padx=14, pady=10,
-            command=lambda: self.show_view("forecasts")
-        )
+        self.btn_forecasts = ttk.Button(self.left, text="Передбачення", style="Nav.TButton",
+                                        command=lambda: self.show_view("forecasts"))
         self.btn_forecasts.pack(padx=16, pady=8, anchor="n", fill="x")
 
-        self.btn_viz = tk.Button(self.left, text="Візуалізація", bg=BLUE_BG, activebackground=BLUE_BG,
-                         relief="groove", bd=2, padx=14, pady=10,
-                         command=lambda: self.show_view("viz"))
+        self.btn_viz = ttk.Button(self.left, text="Візуалізація", style="Nav.TButton",
+                                  command=lambda: self.show_view("viz"))
         self.btn_viz.pack(padx=16, pady=8, anchor="n", fill="x")
 
         # правий стек екранів
@@ -95,64 +143,84 @@ class App(tk.Tk):
 
     # ---------- Views ----------
     def _build_views(self):
-        self.ts_view = TimeseriesView(
-            self.stack,
-            on_add_click=self._open_add_ts,
-            on_rows_changed=self._save_state
-        )
-        self.ts_view.place(relx=0, rely=0, relwidth=1, relheight=1)
-
-        self.models_view = ModelsView(
-            self.stack,
-            on_add_click=self._add_model_modal,
-            on_edit_click=self._edit_model_modal,
-            on_rows_changed=self._save_state
-        )
-        self.models_view.place(relx=0, rely=0, relwidth=1, relheight=1)
-
-        self.forecasts_view = ForecastsView(
-            self.stack, 
-            on_add_click=self._add_forecast_modal, 
-            on_rows_changed=self._save_state,
-            models_view=self.models_view,
-            visualization_view=None # assigned below
-        )
-        self.forecasts_view.place(relx=0, rely=0, relwidth=1, relheight=1)
-
-        self.visualization_view = VisualizationsView(
-            self.stack,
-            on_add_click=self._viz_create_modal,
-            on_view_click=self._viz_open_viewer,
-            on_rows_changed=self._save_state
-        )
-        self.visualization_view.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self._views = {}
+        self._pending_state = {}  # стан екранів, які ще не створені
+        self._view_factories = {
+            "timeseries": lambda: TimeseriesView(
+                self.stack,
+                on_add_click=self._open_add_ts,
+                on_rows_changed=self._on_ts_rows_changed
+            ),
+            "models": lambda: ModelsView(
+                self.stack,
+                on_add_click=self._add_model_modal,
+                on_edit_click=self._edit_model_modal,
+                on_rows_changed=self._save_state
+            ),
+            "forecasts": lambda: ForecastsView(
+                self.stack,
+                on_add_click=self._add_forecast_modal,
+                on_rows_changed=self._save_state,
+                models_view=self.models_view,
+                visualization_view=self.visualization_view
+            ),
+            "viz": lambda: VisualizationsView(
+                self.stack,
+                on_add_click=self._viz_create_modal,
+                on_view_click=self._viz_open_viewer,
+                on_rows_changed=self._save_state
+            ),
+        }
 
-        self.forecasts_view.visualization_view = self.visualization_view
+        # при старті будується лише стартовий екран, решта — при першому зверненні
+        self._get_view("timeseries")
+
+    def _get_view(self, key):
+        view = self._views.get(key)
+        if view is None:
+            view = self._view_factories[key]()
+            view.place(relx=0, rely=0, relwidth=1, relheight=1)
+            view.lower()  # не перекривати поточний екран
+            self._views[key] = view
+            if key in self._pending_state:
+                # відкладений стан вже збережений на диску — не перезаписувати
+                booting, self._booting = self._booting, True
+                view.import_state(self._pending_state.pop(key))
+                self._booting = booting
+        return view
+
+    @property
+    def ts_view(self):
+        return self._get_view("timeseries")
+
+    @property
+    def models_view(self):
+        return self._get_view("models")
+
+    @property
+    def forecasts_view(self):
+        return self._get_view("forecasts")
+
+    @property
+    def visualization_view(self):
+        return self._get_view("viz")
 
     def show_view(self, key: str):
-        if key == "timeseries":
-            self.ts_view.lift()
-        elif key == "models":
-            self.models_view.lift()
-        elif key == "forecasts":
-            self.forecasts_view.lift()
-        else:  # "viz"
-            self.visualization_view.lift()
+        self._get_view(key).lift()
 
     # ---------- Actions used by views ----------
     def _open_add_ts(self):
-        from dialogs.add_timeseries import AddTimeseriesDialog
-
         def on_save(name, files):
 
             lw = LoadingWindow(self, loading_text="Створення часового ряду "+name+"...")
-            lw.top.update_idletasks()
 
             #send timeseries creation to another tread
             def worker():
                 err = None
                 result = None
                 try:
+                    # pandas тягнеться лише тут, а не при старті програми
+                    from modules.timeseries_builder import build_timeseries
                     result = build_timeseries(
                         datasets=files,
                         set_name=name,
@@ -162,30 +230,50 @@ class App(tk.Tk):
                     err = e
                 finally:
                     def finish():
-                        try:
-                            lw.top.destroy()
-                        except Exception:
-                            pass
+                        lw.close()
                         if err:
                             messagebox.showerror("Помилка", str(err), parent=self)
                         else:
                             messagebox.showinfo("Готово", f"Ряд '{name}' створено.", parent=self)
+                            Timeseries.clearCache()
+                            self._invalidate_ts_options()
                             self.ts_view.add_row(name, time=datetime.datetime.now())
 
-                    self.after(0, finish)
+                    self._completions.put(finish)
 
-            threading.Thread(target=worker, daemon=True).start()
+            self._jobs.put(worker)
 
-        AddTimeseriesDialog(self, on_save=on_save)
+        # одне вікно на весь сеанс (створюється в _finish_boot)
+        if self._add_ts_dialog is None:
+            self._add_ts_dialog = AddTimeseriesDialog(self)
+        self._add_ts_dialog.show(on_save)
 
 
+    def _get_entries(self):
+        if self._entries_memo is None:
+            self._entries_memo = Timeseries.getEntries(only_names=True)
+        return self._entries_memo
+
+    def _get_params(self):
+        if self._params_memo is None:
+            self._params_memo = Timeseries.getParams()
+        return self._params_memo
+
+    def _invalidate_ts_options(self):
+        self._entries_memo = None
+        self._params_memo = None
+
+    def _on_ts_rows_changed(self):
+        self._invalidate_ts_options()
+        self._save_state()
+
     def _add_model_modal(self):
         def on_save(model_dict):
             self.models_view.add_row(model_dict["name"], meta=model_dict)
             self._save_state()
 
-        timeseries = Timeseries.getEntries(True, True)
-        params = Timeseries.getParams()
+        timeseries = self._get_entries()
+        params = self._get_params()
 
         AddOrEditModelDialog(
             self,
@@ -196,22 +284,22 @@ class App(tk.Tk):
             models_view=self.models_view
         )
 
-    def _edit_model_modal(self, view, row_widget):
+    def _edit_model_modal(self, view, iid):
         # дістати поточні дані з рядка
-        cur_name, cur_meta = view.get_row_data(row_widget)
+        cur_name, cur_meta = view.get_row_data(iid)
         if not cur_meta:
             cur_meta = {"name": cur_name}
 
         def on_save(updated):
             # оновити назву та метадані в рядку і зберегти стан
-            view.set_row_data(row_widget,
+            view.set_row_data(iid,
                             name=updated.get("name", cur_name),
                             meta=updated)
             self._save_state()
 
         try:
-            timeseries = Timeseries.getEntries(False, True)
-            params = Timeseries.getParams()
+            timeseries = self._get_entries()
+            params = self._get_params()
 
             AddOrEditModelDialog(
                 self,
@@ -227,9 +315,10 @@ class App(tk.Tk):
             messagebox.showerror("Помилка редагування", str(e))
 
     def _add_forecast_modal(self):
+        self._warmup_prophet()
         # список назв моделей зі списку models_view
         model_names = self.models_view.get_names()
-        params = Timeseries.getParams()
+        params = self._get_params()
 
         def on_save(data):
             self._save_state()
@@ -245,7 +334,6 @@ class App(tk.Tk):
                 accuracy = float(data['prob']) / 100
 
                 lw = LoadingWindow(self, loading_text="Передбачення даних параметру "+modal_meta['parameter']+"...")
-                lw.top.update_idletasks()
 
                 #send forecast to another tread
                 def worker():
@@ -258,6 +346,7 @@ class App(tk.Tk):
 
                         smooth_regressors = bool(modal_meta['smooth_regressors'])
                         
+                        from modules.prophet_multivar import forecast_with_regressors
                         forecast_with_regressors(
                             timeseries_dir=Timeseries.fullPath(modal_meta['timeseries']),
                             target=modal_meta['parameter'],
@@ -294,10 +383,7 @@ class App(tk.Tk):
                         err = e
                     finally:
                         def finish():
-                            try:
-                                lw.top.destroy()
-                            except Exception:
-                                pass
+                            lw.close()
                             if err:
                                 raise err
                                 messagebox.showerror("Помилка", str(err), parent=self)
@@ -305,9 +391,9 @@ class App(tk.Tk):
                                 messagebox.showinfo("Готово", f"Передбачення для '{modal_meta['parameter']}' створено.", parent=self)
                                 self.forecasts_view.add_row(data)
 
-                        self.after(0, finish)
+                        self._completions.put(finish)
 
-                threading.Thread(target=worker, daemon=True).start()
+                self._jobs.put(worker)
                 
 
         AddForecastDialog(self, on_save=on_save, model_names=model_names, parameter_options=params, 
@@ -315,7 +401,7 @@ class App(tk.Tk):
 
     def _open_viz_modal(self):
         # імена передбачень беремо з екрана 'Передбачення'
-        forecast_names = [it.get("name","") for it in self.forecasts_view.export_state()]
+        forecast_names = self.forecasts_view.get_names()
         if not forecast_names:
             #from tkinter import messagebox
             messagebox.showinfo("Візуалізація", "Немає передбачень. Спершу створіть їх на відповідній вкладці.")
@@ -330,9 +416,10 @@ class App(tk.Tk):
 
     def _viz_create_modal(self):
         # імена передбачень беремо з екрана 'Передбачення'
+        with_images = Forecast.imagesIndex()
         forecast_names = [
-            d.get("name","") for d in self.forecasts_view.export_state() 
-            if Forecast.hasImages(d.get("name","")) == False
+            name for name in self.forecasts_view.get_names()
+            if name not in with_images
         ]
         if not forecast_names:
             #from tkinter import messagebox
@@ -343,13 +430,13 @@ class App(tk.Tk):
             self._save_state()
 
             lw = LoadingWindow(self, loading_text="Візуалізація передбачення "+viz.get('forecast_name')+"...")
-            lw.top.update_idletasks()
 
             #send forecast render to another tread
             def worker():
                 err = None
                 result = None
                 try:
+                    from modules.forecast_renderer import render_from_json
                     render_from_json(
                         forecast_name=viz.get('forecast_name'),
                         real_data_color=viz.get('real_data_color'),
@@ -359,19 +446,16 @@ class App(tk.Tk):
                     err = e
                 finally:
                     def finish():
-                        try:
-                            lw.top.destroy()
-                        except Exception:
-                            pass
+                        lw.close()
                         if err:
                             messagebox.showerror("Помилка", str(err), parent=self)
                         else:
                             messagebox.showinfo("Готово", f"Візуалізацію для передбачення '{viz.get('forecast_name')}' створено.", parent=self)
                             self.visualization_view.add_row(viz)
 
-                    self.after(0, finish)
+                    self._completions.put(finish)
 
-            threading.Thread(target=worker, daemon=True).start()
+            self._jobs.put(worker)
 
         CreateVisualizationDialog(self, on_save=on_save, forecast_names=forecast_names)
 
@@ -384,12 +468,14 @@ class App(tk.Tk):
 
 
     def _collect_state(self):
-        return {
-            #"timeseries": self.ts_view.export_state(),
-            "models": self.models_view.export_state(),
-            "forecasts": self.forecasts_view.export_state(),
-            "visualizations": self.visualization_view.export_state(),  # <—
-        }
+        state = {}
+        for key, field in (("models", "models"), ("forecasts", "forecasts"), ("viz", "visualizations")):
+            view = self._views.get(key)
+            if view is not None:
+                state[field] = view.export_state()
+            else:
+                state[field] = self._pending_state.get(key) or []
+        return state
 
     def _load_state(self):
         state = load_state()
@@ -398,31 +484,55 @@ class App(tk.Tk):
         timeseries = Timeseries.getEntries()
 
         self.ts_view.import_state(timeseries)
-        self.models_view.import_state(state.get("models"))
-        self.forecasts_view.import_state(state.get("forecasts"))
-        self.visualization_view.import_state(state.get("visualizations"))
+        self._pending_state.update(
+            models=state.get("models"),
+            forecasts=state.get("forecasts"),
+            viz=state.get("visualizations"),
+        )
+        for key, view in list(self._views.items()):
+            if key in self._pending_state:
+                view.import_state(self._pending_state.pop(key))
 
 
     def _save_state(self):
+        # серія змін (видалення кількох рядків поспіль тощо) — один запис на диск
         if getattr(self, "_booting", False):
             return
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(250, self._do_save)
+
+    def _do_save(self):
+        self._save_after_id = None
+        # стан збирається тут (віджети — лише з головного потоку),
+        # а серіалізація й запис на диск — у потоці запису стану
         save_state(self._collect_state())
 
+    def destroy(self):
+        # не втратити зміни, зроблені за останні мілісекунди перед виходом
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._do_save()
+        flush_state()
+        super().destroy()
+
     # ---------- More ----------
     def _about(self):
         messagebox.showinfo("Про програму",
                             "ІС для прогнозування забруднень водних ресурсів України\n"
                             "Каркас GUI (Tkinter).\n© Магістерський проект, автор - ctyurk15")
     def _brutus(self):
-        timeseries = Timeseries.getEntries(True, True)
-        params = Timeseries.getParams()
+        self._warmup_prophet()
+        timeseries = self._get_entries()
+        params = self._get_params()
 
         def on_save(leaderboard):
+            rows = []
             for key, leader in leaderboard.items():
                 model_name = leader['meta']['name']+'-run-'+str(key+1)
                 leader['meta']['name'] = model_name
-                self.models_view.add_row(model_name, meta=leader['meta'])
-                self._save_state()
+                rows.append((model_name, leader['meta']))
+            self.models_view.add_rows(rows)
 
         BrutusDialog(
             self,
@@ -0,0 +1,17 @@
+from tkinter import ttk
+
+_ready = False
+
+def ensure_ttk_ready(root):
+    """
+    Одноразово «прогріває» ttk: перше створення Entry/Combobox/Scrollbar
+    розбирає стилі теми, тож робимо це один раз на інтерпретатор
+    (у App — на idle після старту), а не всередині першого діалогу.
+    """
+    global _ready
+    if _ready:
+        return
+    _ready = True
+    ttk.Style(root)
+    for cls in (ttk.Entry, ttk.Combobox, ttk.Scrollbar):
+        cls(root).destroy()
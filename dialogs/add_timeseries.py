@@ -1,37 +1,66 @@
 import tkinter as tk
 import os
+import threading
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 from theme import BLUE_BG, BG_MAIN, RED_BG
+from modules.window_helpers import center_geometry
+from dialogs._style import ensure_ttk_ready
 from src.timeseries import Timeseries
 
 class AddTimeseriesDialog:
-    """Модалка: назва + вибір кількох файлів з папки raw-datasets (multi-select)."""
-    def __init__(self, master, on_save):
+    """
+    Модалка: назва + вибір кількох файлів з папки raw-datasets (multi-select).
+    Вікно створюється один раз; show() показує його знову з чистою формою,
+    close() лише ховає.
+    """
+    dataset_dir = Path.cwd() / "raw-datasets"
+    _dataset_dir_ready = False
+
+    def __init__(self, master):
         self.master = master
-        self.on_save = on_save
+        self.on_save = None
 
         self.top = tk.Toplevel(master)
+        self.top.withdraw()
+        ensure_ttk_ready(master)
         self.top.title("Новий часовий ряд")
         self.top.transient(master)
-        self.top.grab_set()
         self.top.configure(bg=BLUE_BG)
         self.top.resizable(False, False)
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
 
-        w, h = 520, 320
-        self._center(master, w, h)
-
-        self.dataset_dir = Path.cwd() / "raw-datasets"
-        self.dataset_dir.mkdir(exist_ok=True)
-        self.selected_files = []
+        self._ensure_dataset_dir()
+        self.selected_files = {}  # впорядкована "множина" шляхів
 
         self._build()
 
+    @classmethod
+    def _ensure_dataset_dir(cls):
+        # mkdir — один раз за сеанс і не в потоці інтерфейсу
+        if cls._dataset_dir_ready:
+            return
+        cls._dataset_dir_ready = True
+        threading.Thread(target=cls.dataset_dir.mkdir, kwargs={"exist_ok": True}, daemon=True).start()
+
+    def show(self, on_save):
+        self.on_save = on_save
+        self.name_var.set("")
+        self._clear_all()
+
+        w, h = 520, 320
+        self._center(self.master, w, h)
+        self.top.deiconify()
+        self.top.grab_set()
+
+    def close(self):
+        self.top.grab_release()
+        self.top.withdraw()
+
     def _center(self, master, w, h):
-        self.top.update_idletasks()
-        x = master.winfo_x() + (master.winfo_width() - w) // 2
-        y = master.winfo_y() + (master.winfo_height() - h) // 2
-        self.top.geometry(f"{w}x{h}+{x}+{y}")
+        # розмір вікна задано явно, а батьківське вікно вже відмальоване —
+        # примусовий update_idletasks тут не потрібен
+        self.top.geometry(center_geometry(master, w, h))
 
     def _build(self):
         frm = tk.Frame(self.top, bg=BLUE_BG, bd=2, relief="groove")
@@ -65,7 +94,7 @@ class AddTimeseriesDialog:
         btns = tk.Frame(frm, bg=BLUE_BG)
         btns.grid(row=6, column=0, columnspan=3, sticky="e", pady=(12, 8), padx=8)
         tk.Button(btns, text="Зберегти", bg=BG_MAIN, command=self._save).pack(side="left", padx=(0,8))
-        tk.Button(btns, text="Скасувати", bg=RED_BG, command=self.top.destroy).pack(side="left")
+        tk.Button(btns, text="Скасувати", bg=RED_BG, command=self.close).pack(side="left")
 
     def _browse_files(self):
         paths = filedialog.askopenfilenames(
@@ -73,17 +102,17 @@ class AddTimeseriesDialog:
             initialdir=str(self.dataset_dir),
             filetypes=[("CSV файли", "*.csv"), ("Усі файли", "*.*")]
         )
-        for p in paths:
-            if p not in self.selected_files:
-                self.selected_files.append(p)
-                self.files_listbox.insert("end", p)
+        new = [p for p in dict.fromkeys(paths) if p not in self.selected_files]
+        if new:
+            self.selected_files.update(dict.fromkeys(new))
+            # один виклик insert на весь вибір — одне перемальовування списку
+            self.files_listbox.insert("end", *new)
 
     def _remove_selected(self):
         for idx in list(self.files_listbox.curselection())[::-1]:
             path = self.files_listbox.get(idx)
             self.files_listbox.delete(idx)
-            if path in self.selected_files:
-                self.selected_files.remove(path)
+            self.selected_files.pop(path, None)
 
     def _clear_all(self):
         self.files_listbox.delete(0, "end")
@@ -94,11 +123,10 @@ class AddTimeseriesDialog:
         if not name:
             messagebox.showwarning("Перевірка", "Вкажіть назву часового ряду.")
             return
-        timeseries = Timeseries.getEntries(True, True)
+        timeseries = Timeseries.getEntries(only_names=True)
         if name in timeseries:
             #if name == entry['name']:
             messagebox.showwarning("Перевірка", "Така назва уже існує")
             return
-        self.top.grab_release()
-        self.top.destroy()
+        self.close()
         self.on_save(name, list(self.selected_files))
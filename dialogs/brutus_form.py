@@ -1,12 +1,92 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-from datetime import datetime
+from tkinter import ttk
+from tkinter import font as tkfont
 from theme import BLUE_BG, BG_MAIN, RED_BG
+from modules.window_helpers import center_geometry
+from dialogs._style import ensure_ttk_ready
 from modules.validation_helpers import validate_date, string_is_number, string_to_bool, number_to_bool_string
-from modules.brutus_generator import BrutusGenerator
 
 data_frequencies = ['D', 'W', 'M', 'H', 'Q', 'Y']
 regressor_modes = ['additive', 'multiplicative']
+_FREQS = frozenset(data_frequencies)  # для перевірок; списки — для показу й порядку
+
+# (підзаголовок, його colspan, ((змінна, дефолт) зліва, (змінна, дефолт) справа))
+RANGE_FIELDS = [
+    ("Мінімум / максимум", 2,
+        (("min_value", "0"), ("max_value", "6"))),
+    (f"Частота навчальних & вихідних даних ({','.join(data_frequencies)})", 4,
+        (("model_freq", "D"), ("result_freq", "D"))),
+    ("Цільові межі передбачення (від - до)", 2,
+        (("target_forecast_from", "2006-01-01"), ("target_forecast_to", "2006-12-31"))),
+    #----- Параметри для перебору
+    ("Межі навчання від - до (роки)", 2,
+        (("train_from_year", "2003"), ("train_to_year", "2005"))),
+    ("Вплив індивідуальних регресорів (мінімум - максимум)", 4,
+        (("min_single_regressor_value", "0.1"), ("max_single_regressor_value", "5"))),
+    ("Вплив регресорів (від - до)", 2,
+        (("regressor_prior_scale_min", "0.5"), ("regressor_prior_scale_max", "10"))),
+    ("Кількість останніх точок для лінійної екстраполяції (від - до)", 4,
+        (("regressor_future_linear_window_min", "3"), ("regressor_future_linear_window_max", "30"))),
+    ("Розмір вікна згладжування (від - до)", 2,
+        (("smooth_window_min", "3"), ("smooth_window_max", "30"))),
+    ("Чутливість до зміни тренду (шумність) (від - до)", 4,
+        (("changepoint_prior_scale_min", "0.01"), ("changepoint_prior_scale_max", "1"))),
+    ("Сила впливу сезонності (від - до)", 4,
+        (("seasonality_prior_scale_min", "0.01"), ("seasonality_prior_scale_max", "1"))),
+    ("Множник важливості регресора (від - до)", 4,
+        (("regressor_global_importance_min", "0.1"), ("regressor_global_importance_max", "5"))),
+]
+
+def _is_frequency(value):
+    return value in _FREQS
+
+# (змінна, перевірка, повідомлення) — у порядку показу помилок
+CHECKS = [
+    ("target_forecast_from", validate_date,
+        "Вкажіть коректну цільову дату початку передбачення"),
+    ("target_forecast_to", validate_date,
+        "Вкажіть коректну цільову дату кінця передбачення"),
+    ("model_freq", _is_frequency,
+        f"Вкажіть коректну частоту навчальних даних ({','.join(data_frequencies)})"),
+    ("result_freq", _is_frequency,
+        f"Вкажіть коректну частоту вихідних даних ({','.join(data_frequencies)})"),
+    ("train_from_year", string_is_number,
+        "Вкажіть коректний початковий рік навчання"),
+    ("train_to_year", string_is_number,
+        "Вкажіть коректний кінцевий рік навчання"),
+    ("min_value", string_is_number,
+        "Вкажіть коректне мінімальне значення"),
+    ("max_value", string_is_number,
+        "Вкажіть коректне максимальне значення"),
+    ("min_single_regressor_value", string_is_number,
+        "Вкажіть коректне мінімальне значення впливу індивідуальних регресорів"),
+    ("max_single_regressor_value", string_is_number,
+        "Вкажіть коректне максимальне значення впливу індивідуальних регресорів"),
+    ("regressor_prior_scale_min", string_is_number,
+        "Вкажіть коректне мінімальне значення впливу регресорів"),
+    ("regressor_prior_scale_max", string_is_number,
+        "Вкажіть коректне максимальне значення впливу регресорів"),
+    ("regressor_future_linear_window_min", string_is_number,
+        "Вкажіть коректну мінімальну кількість останніх точок для лінійної екстраполяції"),
+    ("regressor_future_linear_window_max", string_is_number,
+        "Вкажіть коректну максимальну кількість останніх точок для лінійної екстраполяції"),
+    ("smooth_window_min", string_is_number,
+        "Вкажіть коректний мінімальний розмір вікна згладжування"),
+    ("smooth_window_max", string_is_number,
+        "Вкажіть коректний максимальний розмір вікна згладжування"),
+    ("changepoint_prior_scale_min", string_is_number,
+        "Вкажіть коректну мінімальну чутливість до зміни тренду"),
+    ("changepoint_prior_scale_max", string_is_number,
+        "Вкажіть коректну максимальну чутливість до зміни тренду"),
+    ("seasonality_prior_scale_min", string_is_number,
+        "Вкажіть коректну мінімальну cилу впливу сезонності"),
+    ("seasonality_prior_scale_max", string_is_number,
+        "Вкажіть коректну максимальну cилу впливу сезонності"),
+    ("regressor_global_importance_min", string_is_number,
+        "Вкажіть коректний мінімальний множник важливості регресора"),
+    ("regressor_global_importance_max", string_is_number,
+        "Вкажіть коректний максимальний множник важливості регресора"),
+]
 
 class BrutusDialog:
     """
@@ -28,17 +108,16 @@ class BrutusDialog:
         self.regressor_options = regressor_options or []
 
         self.top = tk.Toplevel(master)
+        self.top.withdraw()  # показуємо вже зібраним і відцентрованим
+        ensure_ttk_ready(master)
         self.top.title("Режим Brutus")
-        self.top.transient(master); self.top.grab_set()
+        self.top.transient(master)
         self.top.configure(bg=BLUE_BG)
         self.top.resizable(True, True)
 
         # стартовий розмір і центр
-        self.top.update_idletasks()
         w, h = 640, 560
-        x = master.winfo_x() + (master.winfo_width() - w) // 2
-        y = master.winfo_y() + (master.winfo_height() - h) // 2
-        self.top.geometry(f"{w}x{h}+{x}+{y}")
+        self.top.geometry(center_geometry(master, w, h))
 
         # --- Скрол-контейнер ---
         outer = tk.Frame(self.top, bg=BLUE_BG, bd=2, relief="groove")
@@ -52,8 +131,17 @@ class BrutusDialog:
 
         self.form = tk.Frame(self.canvas, bg=BLUE_BG)
         self._win_id = self.canvas.create_window((0, 0), window=self.form, anchor="nw")
-        self.form.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.bind("<Configure>", lambda e: self.canvas.itemconfigure(self._win_id, width=self.canvas.winfo_width()))
+        # серія подій <Configure> (побудова форми, ресайз) дає одне оновлення на idle-такт
+        self._scroll_after = None
+        self._width_after = None
+        self._canvas_w = 0
+        self.form.bind("<Configure>", self._on_form_configure)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+
+        # один шрифт і спільні опції для всіх підзаголовків форми
+        self._bold = tkfont.Font(family="", size=10, weight="bold")
+        self._label_kw = dict(bg=BLUE_BG, anchor="w")
+        self._sub_grid_kw = dict(sticky="ww", padx=8, pady=(6,2))
 
         # ---- Сітка форми (4 колонки: 2 зліва + 2 справа) ----
         for c in range(4):
@@ -83,132 +171,29 @@ class BrutusDialog:
 
         # Часовий ряд (listbox single)
         self.ts_list = self._make_scroll_list(self.form, row=r, column=0, columnspan=2, height=6, padx=PADX, pady=(0,8))
-        for item in self.timeseries_options:
-            self.ts_list.insert("end", item)
+        if self.timeseries_options:
+            self.ts_list.insert("end", *self.timeseries_options)
 
         # Параметр (listbox single)
         self.param_list = self._make_scroll_list(self.form, row=r, column=2, columnspan=2, height=6, padx=PADX, pady=(0,8))
-        for p in self.parameter_options: 
-            self.param_list.insert("end", p)
+        if self.parameter_options:
+            self.param_list.insert("end", *self.parameter_options)
         self.param_list.selection_set(0)
         r += 1
 
-        # Мін/макс
-        self._subheader(r, "Мінімум / максимум", col=0, colspan=2); r += 1
-        self.min_value = tk.StringVar(value=0)
-        self.max_value = tk.StringVar(value=6)
-        ttk.Entry(self.form, textvariable=self.min_value)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.max_value)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Частоти даних
-        self._subheader(r, f"Частота навчальних & вихідних даних ({','.join(data_frequencies)})", col=0, colspan=4); r += 1
-        self.model_freq = tk.StringVar(value="D")
-        self.result_freq = tk.StringVar(value="D")
-        ttk.Entry(self.form, textvariable=self.model_freq)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.result_freq)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-        
-        # Навчання від–до
-        self._subheader(r, "Цільові межі передбачення (від - до)", col=0, colspan=2); r += 1
-        self.target_forecast_from = tk.StringVar(value="2006-01-01")
-        self.target_forecast_to = tk.StringVar(value="2006-12-31")
-        ttk.Entry(self.form, textvariable=self.target_forecast_from)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.target_forecast_to)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        #----- Параметри для перебору
-
-        # Навчання від–до
-        self._subheader(r, "Межі навчання від - до (роки)", col=0, colspan=2); r += 1
-        self.train_from_year = tk.StringVar(value="2003")
-        self.train_to_year = tk.StringVar(value="2005")
-        ttk.Entry(self.form, textvariable=self.train_from_year)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.train_to_year)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Мін/макс вплив регресорів
-        self._subheader(r, "Вплив індивідуальних регресорів (мінімум - максимум)", col=0, colspan=4); r += 1
-        self.min_single_regressor_value = tk.StringVar(value=0.1)
-        self.max_single_regressor_value = tk.StringVar(value=5)
-        ttk.Entry(self.form, textvariable=self.min_single_regressor_value)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.max_single_regressor_value)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Налаштування регресорів (1)
-        self._subheader(r, "Вплив регресорів (від - до)", col=0, colspan=2)
-        r += 1
-        self.regressor_prior_scale_min = tk.StringVar(value=0.5)
-        self.regressor_prior_scale_max = tk.StringVar(value=10)
-        ttk.Entry(self.form, textvariable=self.regressor_prior_scale_min)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.regressor_prior_scale_max)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Налаштування регресорів (2)
-        self._subheader(r, "Кількість останніх точок для лінійної екстраполяції (від - до)", col=0, colspan=4)
-        r += 1
-        self.regressor_future_linear_window_min = tk.StringVar(value=3)
-        self.regressor_future_linear_window_max = tk.StringVar(value=30)
-        ttk.Entry(self.form, textvariable=self.regressor_future_linear_window_min)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.regressor_future_linear_window_max)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Other settings (1)
-        self._subheader(r, "Розмір вікна згладжування (від - до)", col=0, colspan=2)
-        r += 1
-        self.smooth_window_min = tk.StringVar(value=3)
-        self.smooth_window_max = tk.StringVar(value=30)
-        ttk.Entry(self.form, textvariable=self.smooth_window_min)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.smooth_window_max)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Other settings (2)
-        self._subheader(r, "Чутливість до зміни тренду (шумність) (від - до)", col=0, colspan=4)
-        r += 1
-        self.changepoint_prior_scale_min = tk.StringVar(value=0.01)
-        self.changepoint_prior_scale_max = tk.StringVar(value=1)
-        ttk.Entry(self.form, textvariable=self.changepoint_prior_scale_min)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.changepoint_prior_scale_max)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Other settings (3)
-        self._subheader(r, "Сила впливу сезонності (від - до)", col=0, colspan=4)
-        r += 1
-        self.seasonality_prior_scale_min = tk.StringVar(value=0.01)
-        self.seasonality_prior_scale_max = tk.StringVar(value=1)
-        ttk.Entry(self.form, textvariable=self.seasonality_prior_scale_min)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.seasonality_prior_scale_max)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Other settings (4)
-        self._subheader(r, "Множник важливості регресора (від - до)", col=0, colspan=4)
-        r += 1
-        self.regressor_global_importance_min = tk.StringVar(value=0.1)
-        self.regressor_global_importance_max = tk.StringVar(value=5)
-        ttk.Entry(self.form, textvariable=self.regressor_global_importance_min)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.regressor_global_importance_max)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
+        # Пари полів «від – до»: змінні живуть у self.vars під іменами з RANGE_FIELDS
+        self.vars = {}
+        for title, colspan, pair in RANGE_FIELDS:
+            self._subheader(r, title, col=0, colspan=colspan); r += 1
+            for col, (key, default) in zip((0, 2), pair):
+                var = self.vars[key] = tk.StringVar(value=default)
+                ttk.Entry(self.form, textvariable=var)\
+                    .grid(row=r, column=col, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
+            r += 1
+
+        # Помилки перевірки показуються тут, без окремого вікна
+        self.err = tk.Label(self.form, text="", fg="red", bg=BLUE_BG, anchor="w", justify="left", wraplength=560)
+        self.err.grid(row=r, column=0, columnspan=4, sticky="w", padx=PADX)
         r += 1
 
         # Кнопки
@@ -220,13 +205,38 @@ class BrutusDialog:
         # --- initial selections/weights ---
         #self.weights = {}
 
+        self.top.deiconify()
+        self.top.grab_set()
+
     # --- helpers -------------------------------------------------------------
+    def _on_form_configure(self, event):
+        if self._scroll_after is None:
+            self._scroll_after = self.canvas.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        self._scroll_after = None
+        if not self.canvas.winfo_exists():
+            return  # діалог закрили раніше, ніж настав idle-такт
+        # у канві лише одне вікно — форма, тож її запитаний розмір і є межами
+        self.canvas.configure(scrollregion=(0, 0, self.form.winfo_reqwidth(), self.form.winfo_reqheight()))
+
+    def _on_canvas_configure(self, event):
+        self._canvas_w = event.width
+        if self._width_after is None:
+            self._width_after = self.canvas.after_idle(self._apply_form_width)
+
+    def _apply_form_width(self):
+        self._width_after = None
+        if not self.canvas.winfo_exists():
+            return
+        self.canvas.itemconfigure(self._win_id, width=self._canvas_w)
+
     def _label(self, row, text, col=0):
-        tk.Label(self.form, text=text, bg=BLUE_BG).grid(row=row, column=col, sticky="w", padx=8, pady=(0,2))
+        tk.Label(self.form, text=text, **self._label_kw).grid(row=row, column=col, sticky="w", padx=8, pady=(0,2))
 
     def _subheader(self, row, text, col=0, colspan=1):
-        tk.Label(self.form, text=text, bg=BLUE_BG, font=("", 10, "bold"), anchor='w')\
-            .grid(row=row, column=col, sticky="ww", padx=8, pady=(6,2),columnspan=colspan)
+        tk.Label(self.form, text=text, font=self._bold, **self._label_kw)\
+            .grid(row=row, column=col, columnspan=colspan, **self._sub_grid_kw)
 
     #def _rebuild_weights(self):
     #    for w in self.weights_frame.winfo_children(): w.destroy()
@@ -245,52 +255,27 @@ class BrutusDialog:
     #        ttk.Entry(row, textvariable=var, width=10).pack(side="left")
 
     # --- save ----------------------------------------------------------------
+    def _show_error(self, text):
+        self.err.config(text=text)
+        self.canvas.yview_moveto(1.0)  # повідомлення — поруч із кнопками внизу форми
+
     def _save(self):
+        self.err.config(text="")
         name = self.name_var.get().strip()
         if not name:
-            messagebox.showwarning("Перевірка", "Вкажіть назву моделі.")
+            self._show_error("Вкажіть назву моделі.")
             return
         existing_model = self.models_view.find_model_like_name(name)
         if existing_model != {}:
-            messagebox.showwarning("Перевірка", "Модель/моделі з таким префіксом уже існують")
+            self._show_error("Модель/моделі з таким префіксом уже існують")
             return
 
         # required params
         ts = self.ts_list.get(self.ts_list.curselection()[0]) if self.ts_list.curselection() else None
         param = self.param_list.get(self.param_list.curselection()[0]) if self.param_list.curselection() else None
 
-        target_forecast_from = self.target_forecast_from.get().strip()
-        target_forecast_to = self.target_forecast_to.get().strip()
-
-        result_freq = self.result_freq.get().strip()
-        model_freq = self.model_freq.get().strip()
-
-        min_value = self.min_value.get().strip()
-        max_value = self.max_value.get().strip()
-
-        train_from_year = self.train_from_year.get().strip()
-        train_to_year = self.train_to_year.get().strip()
-
-        min_single_regressor_value = self.min_single_regressor_value.get().strip()
-        max_single_regressor_value = self.max_single_regressor_value.get().strip()
-
-        regressor_prior_scale_min = self.regressor_prior_scale_min.get().strip()
-        regressor_prior_scale_max = self.regressor_prior_scale_max.get().strip()
-
-        regressor_future_linear_window_min = self.regressor_future_linear_window_min.get().strip()
-        regressor_future_linear_window_max = self.regressor_future_linear_window_max.get().strip()
-
-        smooth_window_min = self.smooth_window_min.get().strip()
-        smooth_window_max = self.smooth_window_max.get().strip()
-
-        changepoint_prior_scale_min = self.changepoint_prior_scale_min.get().strip()
-        changepoint_prior_scale_max = self.changepoint_prior_scale_max.get().strip()
-
-        seasonality_prior_scale_min = self.seasonality_prior_scale_min.get().strip()
-        seasonality_prior_scale_max = self.seasonality_prior_scale_max.get().strip()
-
-        regressor_global_importance_min = self.regressor_global_importance_min.get().strip()
-        regressor_global_importance_max = self.regressor_global_importance_max.get().strip()
+        # усі поля читаються один раз
+        vals = {key: var.get().strip() for key, var in self.vars.items()}
 
         #auto-filled
         regressors = self.regressor_options
@@ -305,105 +290,22 @@ class BrutusDialog:
         #weights = {rg: self.weight_vars[rg].get() for rg in self.weight_vars}
         
         if ts == None:
-            messagebox.showwarning("Перевірка", "Вкажіть часовий ряд")
+            self._show_error("Вкажіть часовий ряд")
             return
         if param == None:
-            messagebox.showwarning("Перевірка", "Вкажіть назву параметра")
-            return
-        if validate_date(target_forecast_from) == False:
-            messagebox.showwarning("Перевірка", "Вкажіть коректну цільову дату початку передбачення")
-            return
-        if validate_date(target_forecast_to) == False:
-            messagebox.showwarning("Перевірка", "Вкажіть коректну цільову дату кінця передбачення")
-            return
-        if model_freq not in data_frequencies:
-            messagebox.showwarning("Перевірка", f"Вкажіть коректну частоту навчальних даних ({','.join(data_frequencies)})")
-            return
-        if result_freq not in data_frequencies:
-            messagebox.showwarning("Перевірка", f"Вкажіть коректну частоту вихідних даних ({','.join(data_frequencies)})")
-            return
-        if string_is_number(train_from_year) == False or train_from_year == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректний початковий рік навчання")
-            return
-        if string_is_number(train_to_year) == False or train_to_year == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректний кінцевий рік навчання")
-            return
-        if string_is_number(min_value) == False or min_value == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне мінімальне значення")
-            return
-        if string_is_number(max_value) == False or max_value == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне максимальне значення")
-            return
-        if string_is_number(min_single_regressor_value) == False or min_single_regressor_value == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне мінімальне значення впливу індивідуальних регресорів")
-            return
-        if string_is_number(max_single_regressor_value) == False or max_single_regressor_value == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне максимальне значення впливу індивідуальних регресорів")
-            return
-        if string_is_number(regressor_prior_scale_min) == False or regressor_prior_scale_min == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне мінімальне значення впливу регресорів")
-            return
-        if string_is_number(regressor_prior_scale_max) == False or regressor_prior_scale_max == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне максимальне значення впливу регресорів")
-            return
-        if string_is_number(regressor_future_linear_window_min) == False or regressor_future_linear_window_min == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректну мінімальну кількість останніх точок для лінійної екстраполяції")
-            return
-        if string_is_number(regressor_future_linear_window_max) == False or regressor_future_linear_window_max == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректну максимальну кількість останніх точок для лінійної екстраполяції")
-            return
-        if string_is_number(smooth_window_min) == False or smooth_window_min == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректний мінімальний розмір вікна згладжування")
-            return
-        if string_is_number(smooth_window_max) == False or smooth_window_max == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректний максимальний розмір вікна згладжування")
-            return
-        if string_is_number(changepoint_prior_scale_min) == False or changepoint_prior_scale_min == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректну мінімальну чутливість до зміни тренду")
-            return
-        if string_is_number(changepoint_prior_scale_max) == False or changepoint_prior_scale_max == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректну максимальну чутливість до зміни тренду")
-            return
-        if string_is_number(seasonality_prior_scale_min) == False or seasonality_prior_scale_min == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректну мінімальну cилу впливу сезонності")
-            return
-        if string_is_number(seasonality_prior_scale_max) == False or seasonality_prior_scale_max == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректну максимальну cилу впливу сезонності")
-            return
-        if string_is_number(regressor_global_importance_min) == False or regressor_global_importance_min == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректний мінімальний множник важливості регресора")
-            return
-        if string_is_number(regressor_global_importance_max) == False or regressor_global_importance_max == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректний максимальний множник важливості регресора")
+            self._show_error("Вкажіть назву параметра")
             return
+        for key, is_valid, message in CHECKS:
+            if not is_valid(vals[key]):
+                self._show_error(message)
+                return
 
         payload = dict(
             name=name,
             timeseries=ts,
             parameter=param,
-            target_forecast_from=target_forecast_from,
-            target_forecast_to=target_forecast_to,
-            result_freq=result_freq,
-            model_freq=model_freq,
-            min_value=min_value,
-            max_value=max_value,
-            train_from_year=train_from_year,
-            train_to_year=train_to_year,
-            min_single_regressor_value=min_single_regressor_value,
-            max_single_regressor_value=max_single_regressor_value,
-            regressor_prior_scale_min=regressor_prior_scale_min,
-            regressor_prior_scale_max=regressor_prior_scale_max,
-            regressor_future_linear_window_min=regressor_future_linear_window_min,
-            regressor_future_linear_window_max=regressor_future_linear_window_max,
-            smooth_window_min=smooth_window_min,
-            smooth_window_max=smooth_window_max,
-            changepoint_prior_scale_min=changepoint_prior_scale_min,
-            changepoint_prior_scale_max=changepoint_prior_scale_max,
-            seasonality_prior_scale_min=seasonality_prior_scale_min,
-            seasonality_prior_scale_max=seasonality_prior_scale_max,
-            regressor_global_importance_min=regressor_global_importance_min,
-            regressor_global_importance_max=regressor_global_importance_max,
-            
+            **vals,
+
             regressors=regressors,
             regressor_standardize=regressor_standardize,
             regressor_mode=regressor_mode,
@@ -420,19 +322,23 @@ class BrutusDialog:
     def start_process(self, payload):
         #print(payload)
 
+        # генератор тягне Prophet і pandas — імпортуємо лише коли перебір запускають
+        from modules.brutus_generator import BrutusGenerator
         generator = BrutusGenerator(self.master, payload, self.on_save)
         generator.start()
 
     def _make_scroll_list(self, parent, *, row, column, columnspan=2, height=6, padx=8, pady=(0,8)):
-        """Створює Listbox із вертикальним Scrollbar у фіксованій висоті."""
-        wrap = tk.Frame(parent, bg=BLUE_BG)
-        wrap.grid(row=row, column=column, columnspan=columnspan, sticky="nsew", padx=padx, pady=pady)
-
-        lb = tk.Listbox(wrap, height=height, exportselection=False)
-        lb.pack(side="left", fill="both", expand=True)
-
-        sb = ttk.Scrollbar(wrap, orient="vertical", command=lb.yview)
-        sb.pack(side="right", fill="y")
-
-        lb.configure(yscrollcommand=sb.set)
+        """
+        Створює Listbox із вертикальним Scrollbar у фіксованій висоті.
+        Обидва віджети гридяться прямо в parent, без проміжного фрейму:
+        список займає всі колонки, а справа лишає місце під смугу прокрутки.
+        """
+        sb = ttk.Scrollbar(parent, orient="vertical")
+        lb = tk.Listbox(parent, height=height, exportselection=False, yscrollcommand=sb.set)
+        sb.configure(command=lb.yview)
+
+        left, right = padx if isinstance(padx, tuple) else (padx, padx)
+        lb.grid(row=row, column=column, columnspan=columnspan, sticky="nsew",
+                padx=(left, right + sb.winfo_reqwidth()), pady=pady)
+        sb.grid(row=row, column=column + columnspan - 1, sticky="nse", padx=(0, right), pady=pady)
         return lb
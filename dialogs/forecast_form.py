@@ -1,7 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
+from modules.helpers import format_timestamp
 from theme import BLUE_BG, BG_MAIN, RED_BG
+from modules.window_helpers import center_geometry
+from dialogs._style import ensure_ttk_ready
 
 class AddForecastDialog:
     """
@@ -20,16 +22,15 @@ class AddForecastDialog:
         self.forecasts_view = forecasts_view
 
         self.top = tk.Toplevel(master)
+        self.top.withdraw()  # показуємо вже зібраним і відцентрованим
+        ensure_ttk_ready(master)
         self.top.title("Нове передбачення")
-        self.top.transient(master); self.top.grab_set()
+        self.top.transient(master)
         self.top.configure(bg=BLUE_BG)
         self.top.resizable(False, False)
 
         w, h = 520, 300
-        self.top.update_idletasks()
-        x = master.winfo_x() + (master.winfo_width() - w) // 2
-        y = master.winfo_y() + (master.winfo_height() - h) // 2
-        self.top.geometry(f"{w}x{h}+{x}+{y}")
+        self.top.geometry(center_geometry(master, w, h))
 
         frm = tk.Frame(self.top, bg=BLUE_BG, bd=2, relief="groove")
         frm.pack(fill="both", expand=True, padx=16, pady=16)
@@ -67,6 +68,9 @@ class AddForecastDialog:
         frm.grid_columnconfigure(0, weight=1)
         frm.grid_columnconfigure(1, weight=1)
 
+        self.top.deiconify()
+        self.top.grab_set()
+
     def _save(self):
         name = self.name_var.get().strip()
         if not name:
@@ -84,7 +88,7 @@ class AddForecastDialog:
             forecast_from=self.from_var.get().strip(),
             forecast_to=self.to_var.get().strip(),
             prob=self.prob_var.get().strip(),
-            created_at=datetime.now().strftime("%d.%m.%Y %H:%M"),
+            created_at=format_timestamp(),
         )
         self.top.grab_release(); self.top.destroy()
         self.on_save(data)
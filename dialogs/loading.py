@@ -1,24 +1,53 @@
 import tkinter as tk
 from datetime import datetime
 from theme import BLUE_BG, BG_MAIN, RED_BG
+from modules.window_helpers import center_geometry
 
 class LoadingWindow:
+    """
+    Вікно очікування. Toplevel створюється один раз і далі лише
+    показується/ховається; кожен LoadingWindow(...) має свій close(),
+    а вікно ховається, коли закрились усі, хто його відкривав.
+    """
+    _instance = None
 
-    def __init__(self, master, loading_text, width=300, height=70):
+    def __new__(cls, master, loading_text, width=300, height=70):
+        inst = cls._instance
+        if inst is None or inst.master is not master or not inst.top.winfo_exists():
+            inst = super().__new__(cls)
+            inst._build(master)
+            cls._instance = inst
+        inst._open(loading_text, width, height)
+        return inst
+
+    def _build(self, master):
         self.master = master
+        self._users = 0
 
         self.top = tk.Toplevel(master)
+        self.top.withdraw()
         self.top.title("Загрузка...")
-        self.top.transient(master); self.top.grab_set()
+        self.top.transient(master)
         self.top.configure(bg=BLUE_BG); self.top.resizable(False, False)
 
-        #w, h = 300, 70
-        x = master.winfo_x() + (master.winfo_width() - width) // 2
-        y = master.winfo_y() + (master.winfo_height() - height) // 2
-        self.top.geometry(f"{width}x{height}+{x}+{y}")
-
-        self.text_container = tk.Label(self.top, text=loading_text, bg=BLUE_BG)
+        self.text_container = tk.Label(self.top, text="", bg=BLUE_BG)
         self.text_container.grid(row=0, column=0, sticky="w", padx=8, pady=8)
 
+    def _open(self, loading_text, width, height):
+        self._users += 1
+        self.change_text(loading_text)
+        self.top.geometry(center_geometry(self.master, width, height))
+        self.top.deiconify()
+        self.top.lift()
+        self.top.grab_set()
+
     def change_text(self, text):
-        self.text_container.config(text=text)
\ No newline at end of file
+        self.text_container.config(text=text)
+
+    def close(self):
+        if not self.top.winfo_exists():
+            return
+        self._users = max(self._users - 1, 0)
+        if self._users == 0:
+            self.top.grab_release()
+            self.top.withdraw()
@@ -1,11 +1,88 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-from datetime import datetime
+from tkinter import ttk, messagebox, font as tkfont
+from modules.helpers import format_timestamp
 from theme import BLUE_BG, BG_MAIN, RED_BG
+from modules.window_helpers import center_geometry
+from dialogs._style import ensure_ttk_ready
 from modules.validation_helpers import validate_date, string_is_number, string_to_bool, number_to_bool_string
 
 data_frequencies = ['D', 'W', 'M', 'H', 'Q', 'Y']
 regressor_modes = ['additive', 'multiplicative']
+_FREQS = frozenset(data_frequencies)  # для перевірок; списки — для показу
+_MODES = frozenset(regressor_modes)
+
+# рядок форми: ((підзаголовок, колонка, colspan), ...) над ((змінна, дефолт), ...) у колонках 0 і 2
+BASE_FIELDS = [
+    ((("Навчання від - до", 0, 1),),
+        (("train_from", "2003-01-01"), ("train_to", "2005-12-31"))),
+    ((("Мінімум / максимум", 0, 2),),
+        (("min_value", "0"), ("max_value", "6"))),
+    (((f"Частота навчальних & вихідних даних ({','.join(data_frequencies)})", 0, 4),),
+        (("model_freq", "D"), ("result_freq", "D"))),
+]
+# після регресорів і ваг
+TUNING_FIELDS = [
+    ((("Вплив регресорів (0.01 -> 10)", 0, 2), ("Масштабувати регресор? (True, False, auto)", 2, 2)),
+        (("regressor_prior_scale", 0.5), ("regressor_standardize", "auto"))),
+    (((f"Режим регресора ({','.join(regressor_modes)})", 0, 2), ("Згладжувати регресор? (True, False)", 2, 2)),
+        (("regressor_mode", "additive"), ("smooth_regressors", "1"))),
+    #was 120
+    ((("Кількість останніх точок для лінійної екстраполяції (3 -> 30)", 0, 3),),
+        (("regressor_future_linear_window", 10),)),
+    ((("Розмір вікна згладжування (3 -> 30)", 0, 2), ("Чутливість до зміни тренду (шумність) (0.01 -> 1)", 2, 2)),
+        (("smooth_window", 7), ("changepoint_prior_scale", 0.05))),
+    ((("Сила впливу сезонності (0.1 -> 15)", 0, 2), ("Множник важливості регресора (0.1 -> 5)", 2, 2)),
+        (("seasonality_prior_scale", 5), ("regressor_global_importance", 0.2))),
+]
+# зберігаються як bool; у полі показуються як True/False
+_BOOL_FIELDS = ("regressor_standardize", "smooth_regressors")
+
+def _is_frequency(value):
+    return value in _FREQS
+
+def _is_mode(value):
+    return value in _MODES
+
+def _is_bool(value):
+    return type(value) == bool
+
+def _is_bool_or_auto(value):
+    return type(value) == bool or value == 'auto'
+
+# (змінна, перевірка, повідомлення) — у порядку показу помилок;
+# bool-поля перевіряються вже після string_to_bool
+CHECKS = [
+    ("train_from", validate_date,
+        "Вкажіть коректну дату початку навчання"),
+    ("train_to", validate_date,
+        "Вкажіть коректну дату кінця навчання"),
+    ("min_value", string_is_number,
+        "Вкажіть коректне мінімальне значення"),
+    ("max_value", string_is_number,
+        "Вкажіть коректне максимальне значення"),
+    ("model_freq", _is_frequency,
+        f"Вкажіть коректну частоту навчальних даних ({','.join(data_frequencies)})"),
+    ("result_freq", _is_frequency,
+        f"Вкажіть коректну частоту вихідних даних ({','.join(data_frequencies)})"),
+    ("regressor_prior_scale", string_is_number,
+        "Вкажіть коректний вплив регресорів"),
+    ("regressor_standardize", _is_bool_or_auto,
+        "Вкажіть коректне значеня для масштабування регресорів"),
+    ("regressor_mode", _is_mode,
+        f"Вкажіть коректний режм регресора ({','.join(regressor_modes)})"),
+    ("smooth_regressors", _is_bool,
+        "Вкажіть коректне значеня для згладжуванння регресорів"),
+    ("regressor_future_linear_window", string_is_number,
+        "Вкажіть коректну кількість останніх точок для лінійної екстраполяції"),
+    ("smooth_window", string_is_number,
+        "Вкажіть коректне значеня розміру вікна згладжування"),
+    ("changepoint_prior_scale", string_is_number,
+        "Вкажіть коректне значеня чутливості до зміни тренду"),
+    ("seasonality_prior_scale", string_is_number,
+        "Вкажіть коректне значеня сили впливу сезонності"),
+    ("regressor_global_importance", string_is_number,
+        "Вкажіть коректне значеня множника важливості регресора"),
+]
 
 class AddOrEditModelDialog:
     """
@@ -27,10 +104,16 @@ class AddOrEditModelDialog:
         self.timeseries_options = timeseries_options or []
         self.parameter_options = parameter_options or []
         self.regressor_options = regressor_options or []
+        # позиції варіантів у списках — для відновлення вибору без .index()
+        self._ts_idx = {v: i for i, v in enumerate(self.timeseries_options)}
+        self._param_idx = {v: i for i, v in enumerate(self.parameter_options)}
+        self._reg_idx = {v: i for i, v in enumerate(self.regressor_options)}
 
         self.top = tk.Toplevel(master)
+        self.top.withdraw()  # показуємо вже відцентрованим
+        ensure_ttk_ready(master)
         self.top.title("Нова модель" if not initial else "Редагувати модель")
-        self.top.transient(master); self.top.grab_set()
+        self.top.transient(master)
         self.top.configure(bg=BLUE_BG)
         self.top.resizable(True, True)
         if initial != None:
@@ -39,17 +122,14 @@ class AddOrEditModelDialog:
             self.initial_name = ''
 
         # стартовий розмір і центр
-        self.top.update_idletasks()
         w, h = 640, 560
-        x = master.winfo_x() + (master.winfo_width() - w) // 2
-        y = master.winfo_y() + (master.winfo_height() - h) // 2
-        self.top.geometry(f"{w}x{h}+{x}+{y}")
+        self.top.geometry(center_geometry(master, w, h))
 
         # --- Скрол-контейнер ---
         outer = tk.Frame(self.top, bg=BLUE_BG, bd=2, relief="groove")
         outer.pack(fill="both", expand=True, padx=12, pady=12)
 
-        self.canvas = tk.Canvas(outer, bg=BLUE_BG, highlightthickness=0)
+        self.canvas = tk.Canvas(outer, bg=BLUE_BG, highlightthickness=0, yscrollincrement=20)
         vsb = ttk.Scrollbar(outer, orient="vertical", command=self.canvas.yview)
         self.canvas.configure(yscrollcommand=vsb.set)
         self.canvas.pack(side="left", fill="both", expand=True)
@@ -57,8 +137,31 @@ class AddOrEditModelDialog:
 
         self.form = tk.Frame(self.canvas, bg=BLUE_BG)
         self._win_id = self.canvas.create_window((0, 0), window=self.form, anchor="nw")
-        self.form.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.bind("<Configure>", lambda e: self.canvas.itemconfigure(self._win_id, width=self.canvas.winfo_width()))
+        # серія подій <Configure> (побудова форми, ресайз) дає одне оновлення на idle-такт
+        self._scroll_after = None
+        self._width_after = None
+        self._canvas_w = 0
+        self._last_canvas_w = None
+        self.form.bind("<Configure>", self._on_form_configure)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        # колесо миші над будь-яким місцем діалогу: прив'язка на Toplevel
+        # (є в bindtags кожного нащадка) і зникає разом із ним
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.top.bind(seq, self._on_wheel)
+
+        # вікно з'являється одразу, а поля форми будуються на наступному idle-такті
+        self._loading = tk.Label(self.form, text="Завантаження…", bg=BLUE_BG)
+        self._loading.grid(row=0, column=0, sticky="w", padx=8, pady=8)
+        self.top.deiconify()
+        self.top.after_idle(self._build_form, initial)
+
+    def _build_form(self, initial):
+        if not self.top.winfo_exists():
+            return
+        self._loading.destroy()
+
+        # один шрифт на всі підзаголовки форми
+        self._bold = tkfont.Font(family="", size=10, weight="bold")
 
         # ---- Сітка форми (4 колонки: 2 зліва + 2 справа) ----
         for c in range(4):
@@ -69,187 +172,199 @@ class AddOrEditModelDialog:
         # Назва
         self._label(r, "…Назва моделі…"); r += 1
         self.name_var = tk.StringVar(value=(initial or {}).get("name",""))
-        ttk.Entry(self.form, textvariable=self.name_var)\
-            .grid(row=r, column=0, columnspan=4, sticky="ew", padx=PADX, pady=(0,8)); r += 1
+        self._grid_entry(row=r, col=0, colspan=4, var=self.name_var); r += 1
 
         # Заголовки ліво/право
         self._subheader(r, "Часовий ряд", col=0)
         self._subheader(r, "Параметр", col=2); r += 1
 
         # Часовий ряд (listbox single)
-        self.ts_list = self._make_scroll_list(self.form, row=r, column=0, columnspan=2, height=6, padx=PADX, pady=(0,8))
-        for item in self.timeseries_options:
-            self.ts_list.insert("end", item)
+        self.ts_list, self.ts_var = self._make_scroll_list(self.form, self.timeseries_options, row=r, column=0, columnspan=2, height=6, padx=PADX, pady=(0,8))
 
         # Параметр (listbox single)
-        self.param_list = self._make_scroll_list(self.form, row=r, column=2, columnspan=2, height=6, padx=PADX, pady=(0,8))
-        for p in self.parameter_options: 
-            self.param_list.insert("end", p)
+        self.param_list, self.param_var = self._make_scroll_list(self.form, self.parameter_options, row=r, column=2, columnspan=2, height=6, padx=PADX, pady=(0,8))
         self.param_list.selection_set(0)
         r += 1
 
-        # Навчання від–до
-        self._subheader(r, "Навчання від - до", col=0); r += 1
-        self.train_from = tk.StringVar(value=(initial or {}).get("train_from", "2003-01-01"))
-        self.train_to   = tk.StringVar(value=(initial or {}).get("train_to",   "2005-12-31"))
-        ttk.Entry(self.form, textvariable=self.train_from)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.train_to)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Мін/макс
-        self._subheader(r, "Мінімум / максимум", col=0, colspan=2); r += 1
-        self.min_value = tk.StringVar(value=(initial or {}).get("min_value", "0"))
-        self.max_value = tk.StringVar(value=(initial or {}).get("max_value", "6"))
-        ttk.Entry(self.form, textvariable=self.min_value)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.max_value)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Частоти даних
-        self._subheader(r, f"Частота навчальних & вихідних даних ({','.join(data_frequencies)})", col=0, colspan=4); r += 1
-        self.model_freq = tk.StringVar(value=(initial or {}).get("model_freq", "D"))
-        self.result_freq = tk.StringVar(value=(initial or {}).get("result_freq", "D"))
-        ttk.Entry(self.form, textvariable=self.model_freq)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.result_freq)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
+        # Поля-рядки: змінні живуть у self.vars під іменами з BASE_FIELDS / TUNING_FIELDS
+        self.vars = {}
+        r = self._add_field_rows(r, BASE_FIELDS, initial or {})
 
         # Регресори + ваги
         self._subheader(r, "Регресори", col=0)
         self._subheader(r, "Вага регресорів", col=2); r += 1
 
-        self.reg_list = self._make_scroll_list(self.form, row=r, column=0, columnspan=2, height=6, padx=PADX, pady=(0,8))
+        self.reg_list, self.reg_var = self._make_scroll_list(self.form, self.regressor_options, row=r, column=0, columnspan=2, height=6, padx=PADX, pady=(0,8))
         self.reg_list.config(selectmode="multiple")
-        for rg in self.regressor_options: 
-            self.reg_list.insert("end", rg)
 
         self.weights_frame = tk.Frame(self.form, bg=BLUE_BG)
         self.weights_frame.grid(row=r, column=2, columnspan=2, sticky="nsew", padx=PADX, pady=(0,8))
+        self.weights_frame.grid_columnconfigure(1, weight=1)
+        self._weight_rows = {}  # name -> (label, entry); живуть, поки регресор вибраний
+        self.weight_vars = {}
+        self._no_weights = tk.Label(self.weights_frame, text="(не вибрано)", bg=BLUE_BG)
         r += 1
 
-        self.reg_list.bind("<<ListboxSelect>>", lambda e: self._rebuild_weights())
-
-        # Налаштування регресорів (1)
-        self._subheader(r, "Вплив регресорів (0.01 -> 10)", col=0, colspan=2)
-        self._subheader(r, "Масштабувати регресор? (True, False, auto)", col=2, colspan=2)
-        r += 1
-        self.regressor_prior_scale = tk.StringVar(value=(initial or {}).get("regressor_prior_scale", 0.5))
-        self.regressor_standardize = tk.StringVar(value=(initial or {}).get("regressor_standardize", "auto"))
-        regressor_standardize_val = self.regressor_standardize.get().strip()
-        self.regressor_standardize.set(number_to_bool_string(regressor_standardize_val))
-        ttk.Entry(self.form, textvariable=self.regressor_prior_scale)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.regressor_standardize)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Налаштування регресорів (2)
-        self._subheader(r, f"Режим регресора ({','.join(regressor_modes)})", col=0, colspan=2)
-        self._subheader(r, "Згладжувати регресор? (True, False)", col=2, colspan=2)
-        r += 1
-        self.regressor_mode = tk.StringVar(value=(initial or {}).get("regressor_mode", 'additive'))
-        self.smooth_regressors = tk.StringVar(value=(initial or {}).get("smooth_regressors", '1'))
-        smooth_regressors_val = self.smooth_regressors.get().strip()
-        self.smooth_regressors.set(number_to_bool_string(smooth_regressors_val))
-        ttk.Entry(self.form, textvariable=self.regressor_mode)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.smooth_regressors)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Налаштування регресорів (3)
-        #was 120
-        self._subheader(r, "Кількість останніх точок для лінійної екстраполяції (3 -> 30)", col=0, colspan=3)
-        r += 1
-        self.regressor_future_linear_window = tk.StringVar(value=(initial or {}).get("regressor_future_linear_window", 10))
-        ttk.Entry(self.form, textvariable=self.regressor_future_linear_window)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Other settings (1)
-        self._subheader(r, "Розмір вікна згладжування (3 -> 30)", col=0, colspan=2)
-        self._subheader(r, "Чутливість до зміни тренду (шумність) (0.01 -> 1)", col=2, colspan=2)
-        r += 1
-        self.smooth_window = tk.StringVar(value=(initial or {}).get("smooth_window", 7))
-        self.changepoint_prior_scale = tk.StringVar(value=(initial or {}).get("changepoint_prior_scale", 0.05))
-        ttk.Entry(self.form, textvariable=self.smooth_window)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.changepoint_prior_scale)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
+        # утримання Shift+↓ дає серію подій — ваги перебудовуються раз після паузи
+        self._wt_after = None
+        self.reg_list.bind("<<ListboxSelect>>", lambda e: self._schedule_rebuild())
 
-        # Other settings (2)
-        self._subheader(r, "Сила впливу сезонності (0.1 -> 15)", col=0, colspan=2)
-        self._subheader(r, "Множник важливості регресора (0.1 -> 5)", col=2, colspan=2)
-        r += 1
-        self.seasonality_prior_scale = tk.StringVar(value=(initial or {}).get("seasonality_prior_scale", 5))
-        self.regressor_global_importance = tk.StringVar(value=(initial or {}).get("regressor_global_importance", 0.2))
-        ttk.Entry(self.form, textvariable=self.seasonality_prior_scale)\
-            .grid(row=r, column=0, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        ttk.Entry(self.form, textvariable=self.regressor_global_importance)\
-            .grid(row=r, column=2, columnspan=2, sticky="ew", padx=PADX, pady=(0,8))
-        r += 1
-
-        # Кнопки
-        btns = tk.Frame(self.form, bg=BLUE_BG)
-        btns.grid(row=r, column=0, columnspan=4, sticky="e", padx=PADX, pady=(6, 4))
-        tk.Button(btns, text="Зберегти", bg=BG_MAIN, command=self._save).pack(side="left", padx=(0,8))
-        tk.Button(btns, text="Скасувати", bg=RED_BG, command=self.top.destroy).pack(side="left")
+        # налаштування й кнопки лежать нижче видимої частини вікна —
+        # їх добудовуємо на наступному idle-такті, коли верх форми вже намальований
+        self.top.after_idle(self._build_tuning, r, initial)
 
         # --- initial selections/weights ---
         self.weights = {}
         if initial:
             # timeseries
-            if initial.get("timeseries") in self.timeseries_options:
+            i = self._ts_idx.get(initial.get("timeseries"))
+            if i is not None:
                 self.ts_list.selection_clear(0, "end")
-                self.ts_list.selection_set(self.timeseries_options.index(initial["timeseries"]))
-                self.ts_list.see(self.timeseries_options.index(initial["timeseries"]))
+                self.ts_list.selection_set(i)
+                self.ts_list.see(i)
             # parameter
-            if initial.get("parameter") in self.parameter_options:
+            i = self._param_idx.get(initial.get("parameter"))
+            if i is not None:
                 self.param_list.selection_clear(0, "end")
-                self.param_list.selection_set(self.parameter_options.index(initial["parameter"]))
-                self.param_list.see(self.parameter_options.index(initial["parameter"]))
+                self.param_list.selection_set(i)
+                self.param_list.see(i)
             # regressors + weights
             regs = initial.get("regressors") or []
-            idxs = [self.regressor_options.index(r) for r in regs if r in self.regressor_options]
-            for i in idxs: self.reg_list.selection_set(i)
+            # збережені регресори, яких уже немає серед варіантів, пропускаються
+            for i in map(self._reg_idx.get, regs):
+                if i is not None: self.reg_list.selection_set(i)
             self.weights = {k: str(v) for k, v in (initial.get("weights") or {}).items()}
         self._rebuild_weights()
 
+        self.top.grab_set()
+
+    def _build_tuning(self, r, initial):
+        if not self.top.winfo_exists():
+            return
+        r = self._add_field_rows(r, TUNING_FIELDS, initial or {})
+        for key in _BOOL_FIELDS:
+            self.vars[key].set(number_to_bool_string(self.vars[key].get().strip()))
+
+        # Кнопки
+        btns = tk.Frame(self.form, bg=BLUE_BG)
+        btns.grid(row=r, column=0, columnspan=4, sticky="e", padx=8, pady=(6, 4))
+        self._save_btn = tk.Button(btns, text="Зберегти", bg=BG_MAIN, command=self._save)
+        self._save_btn.pack(side="left", padx=(0,8))
+        tk.Button(btns, text="Скасувати", bg=RED_BG, command=self.top.destroy).pack(side="left")
+
     # --- helpers -------------------------------------------------------------
+    def _on_form_configure(self, event):
+        if self._scroll_after is None:
+            self._scroll_after = self.canvas.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        self._scroll_after = None
+        if not self.canvas.winfo_exists():
+            return  # діалог закрили раніше, ніж настав idle-такт
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def _on_canvas_configure(self, event):
+        self._canvas_w = event.width
+        if self._width_after is None:
+            self._width_after = self.canvas.after_idle(self._apply_form_width)
+
+    def _apply_form_width(self):
+        self._width_after = None
+        if not self.canvas.winfo_exists() or self._canvas_w == self._last_canvas_w:
+            return  # змінилася лише висота — ширина форми та сама
+        self._last_canvas_w = self._canvas_w
+        self.canvas.itemconfigure(self._win_id, width=self._canvas_w)
+
+    def _add_field_rows(self, r, rows, initial):
+        for headers, fields in rows:
+            for text, col, colspan in headers:
+                self._subheader(r, text, col=col, colspan=colspan)
+            r += 1
+            for col, (key, default) in zip((0, 2), fields):
+                var = self.vars[key] = tk.StringVar(value=initial.get(key, default))
+                self._grid_entry(row=r, col=col, colspan=2, var=var)
+            r += 1
+        return r
+
+    def _on_wheel(self, event):
+        if isinstance(event.widget, tk.Listbox):
+            return  # списки прокручуються самі
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        # один поштовх колеса — три рядки по 20px
+        self.canvas.yview_scroll(step * 3, "units")
+
+    def _grid_entry(self, *, row, col, colspan, var):
+        e = ttk.Entry(self.form, textvariable=var)
+        e.grid(row=row, column=col, columnspan=colspan, sticky="ew", padx=8, pady=(0,8))
+        return e
+
     def _label(self, row, text, col=0):
         tk.Label(self.form, text=text, bg=BLUE_BG).grid(row=row, column=col, sticky="w", padx=8, pady=(0,2))
 
     def _subheader(self, row, text, col=0, colspan=1):
-        tk.Label(self.form, text=text, bg=BLUE_BG, font=("", 10, "bold"), anchor='w')\
+        tk.Label(self.form, text=text, bg=BLUE_BG, font=self._bold, anchor='w')\
             .grid(row=row, column=col, sticky="ww", padx=8, pady=(6,2),columnspan=colspan)
 
+    def _schedule_rebuild(self):
+        if self._wt_after is not None:
+            self.top.after_cancel(self._wt_after)
+        self._wt_after = self.top.after(50, self._rebuild_weights)
+
     def _rebuild_weights(self):
-        for w in self.weights_frame.winfo_children(): w.destroy()
-        self.weight_vars = {}
-        sel_idx = self.reg_list.curselection()
-        if not sel_idx:
-            tk.Label(self.weights_frame, text="(не вибрано)", bg=BLUE_BG).pack(anchor="w")
-            return
-        for i in sel_idx:
-            name = self.reg_list.get(i)
+        self._wt_after = None
+        if not self.weights_frame.winfo_exists():
+            return  # діалог закрили, поки чекали паузи
+        # рядки ваг змінюються лише для тих регресорів, чий вибір змінився;
+        # рядок стоїть у рядку сітки з індексом регресора, тож порядок як у списку
+        selected = {self.reg_list.get(i): i for i in self.reg_list.curselection()}
+        for name in set(self._weight_rows) - set(selected):
+            self.weights[name] = self.weight_vars.pop(name).get()  # повернеться при повторному виборі
+            for w in self._weight_rows.pop(name):
+                w.destroy()
+        for name, idx in selected.items():
+            if name in self._weight_rows:
+                continue
             var = tk.StringVar(value=self.weights.get(name, "1"))
             self.weight_vars[name] = var
-            row = tk.Frame(self.weights_frame, bg=BLUE_BG)
-            row.pack(fill="x", pady=2)
-            tk.Label(row, text=name, bg=BLUE_BG, width=14, anchor="w").pack(side="left")
-            ttk.Entry(row, textvariable=var, width=10).pack(side="left")
+            # підпис і поле — прямо в сітці weights_frame, без проміжного Frame
+            lbl = tk.Label(self.weights_frame, text=name, bg=BLUE_BG, width=14, anchor="w")
+            lbl.grid(row=idx, column=0, sticky="w", pady=2)
+            ent = ttk.Entry(self.weights_frame, textvariable=var, width=10)
+            ent.grid(row=idx, column=1, sticky="w")
+            self._weight_rows[name] = (lbl, ent)
+
+        if selected:
+            self._no_weights.grid_remove()
+        else:
+            self._no_weights.grid(row=0, column=0, columnspan=2, sticky="w")
 
     # --- save ----------------------------------------------------------------
     def _save(self):
+        # подвійний клік по «Зберегти» не запускає перевірку вдруге
+        if str(self._save_btn["state"]) == "disabled":
+            return
+        self._save_btn.config(state="disabled")
+        try:
+            self._validate_and_save()
+        finally:
+            if self._save_btn.winfo_exists():
+                self._save_btn.config(state="normal")
+
+    def _validate_and_save(self):
+        if self._wt_after is not None:
+            # вибір змінився щойно — ваги мають відповідати йому
+            self.top.after_cancel(self._wt_after)
+            self._rebuild_weights()
         name = self.name_var.get().strip()
         if not name:
             messagebox.showwarning("Перевірка", "Вкажіть назву моделі.")
             return
+        # без кешу: фоновий Brutus може додати моделі, поки модалка відкрита
         existing_model = self.models_view.find_model_by_name(name)
         if existing_model != {} and self.initial_name != name:
             messagebox.showwarning("Перевірка", "Така назва вже існує")
@@ -259,31 +374,10 @@ class AddOrEditModelDialog:
         ts = self.ts_list.get(self.ts_list.curselection()[0]) if self.ts_list.curselection() else None
         param = self.param_list.get(self.param_list.curselection()[0]) if self.param_list.curselection() else None
 
-        train_from = self.train_from.get().strip()
-        train_to = self.train_to.get().strip()
-
-        min_value = self.min_value.get().strip()
-        max_value = self.max_value.get().strip()
-
-        result_freq = self.result_freq.get().strip()
-        model_freq = self.model_freq.get().strip()
-
-        regressor_prior_scale = self.regressor_prior_scale.get().strip()
-
-        regressor_standardize_raw = self.regressor_standardize.get().strip()
-        regressor_standardize = ''
-        if regressor_standardize_raw == 'auto': regressor_standardize = 'auto'
-        else: regressor_standardize = string_to_bool(regressor_standardize_raw)
-
-        regressor_mode = self.regressor_mode.get().strip()
-        smooth_regressors = string_to_bool(self.smooth_regressors.get().strip())
-        regressor_future_linear_window = self.regressor_future_linear_window.get().strip()
-
-        smooth_window = self.smooth_window.get().strip()
-        changepoint_prior_scale = self.changepoint_prior_scale.get().strip()
-
-        seasonality_prior_scale = self.seasonality_prior_scale.get().strip()
-        regressor_global_importance = self.regressor_global_importance.get().strip()
+        vals = {key: var.get().strip() for key, var in self.vars.items()}
+        if vals["regressor_standardize"] != 'auto':
+            vals["regressor_standardize"] = string_to_bool(vals["regressor_standardize"])
+        vals["smooth_regressors"] = string_to_bool(vals["smooth_regressors"])
 
         # optional params
         sel_regs = [self.reg_list.get(i) for i in self.reg_list.curselection()]
@@ -295,88 +389,38 @@ class AddOrEditModelDialog:
         if param == None:
             messagebox.showwarning("Перевірка", "Вкажіть назву параметра")
             return
-        if validate_date(train_from) == False:
-            messagebox.showwarning("Перевірка", "Вкажіть коректну дату початку навчання")
-            return
-        if validate_date(train_to) == False:
-            messagebox.showwarning("Перевірка", "Вкажіть коректну дату кінця навчання")
-            return
-        if string_is_number(min_value) == False or min_value == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне мінімальне значення")
-            return
-        if string_is_number(max_value) == False or max_value == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне максимальне значення")
-            return
-        if model_freq not in data_frequencies:
-            messagebox.showwarning("Перевірка", f"Вкажіть коректну частоту навчальних даних ({','.join(data_frequencies)})")
-            return
-        if result_freq not in data_frequencies:
-            messagebox.showwarning("Перевірка", f"Вкажіть коректну частоту вихідних даних ({','.join(data_frequencies)})")
-            return
-        if string_is_number(regressor_prior_scale) == False or regressor_prior_scale == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректний вплив регресорів")
-            return regressor_standardize
-        if type(regressor_standardize) != bool and regressor_standardize != 'auto':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне значеня для масштабування регресорів")
-            return
-        if regressor_mode not in regressor_modes:
-            messagebox.showwarning("Перевірка", f"Вкажіть коректний режм регресора ({','.join(regressor_modes)})")
-            return
-        if type(smooth_regressors) != bool:
-            messagebox.showwarning("Перевірка", "Вкажіть коректне значеня для згладжуванння регресорів")
-            return
-        if string_is_number(regressor_future_linear_window) == False or regressor_future_linear_window == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректну кількість останніх точок для лінійної екстраполяції")
-            return
-        if string_is_number(smooth_window) == False or smooth_window == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне значеня розміру вікна згладжування")
-            return
-        if string_is_number(changepoint_prior_scale) == False or changepoint_prior_scale == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне значеня чутливості до зміни тренду")
-            return
-        if string_is_number(seasonality_prior_scale) == False or seasonality_prior_scale == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне значеня сили впливу сезонності")
-            return
-        if string_is_number(regressor_global_importance) == False or regressor_global_importance == '':
-            messagebox.showwarning("Перевірка", "Вкажіть коректне значеня множника важливості регресора")
-            return
+        for key, is_valid, message in CHECKS:
+            if not is_valid(vals[key]):
+                messagebox.showwarning("Перевірка", message)
+                return
 
         payload = dict(
             name=name,
             timeseries=ts,
             parameter=param,
-            train_from=train_from,
-            train_to=train_to,
-            min_value=min_value,
-            max_value=max_value,
-            result_freq=result_freq,
-            model_freq=model_freq,
             regressors=sel_regs,
             weights=weights,
-            regressor_prior_scale=regressor_prior_scale,
-            regressor_standardize=regressor_standardize,
-            regressor_mode=regressor_mode,
-            smooth_regressors=smooth_regressors,
-            regressor_future_linear_window=regressor_future_linear_window,
-            smooth_window=smooth_window,
-            changepoint_prior_scale=changepoint_prior_scale,
-            seasonality_prior_scale=seasonality_prior_scale,
-            regressor_global_importance=regressor_global_importance,
-            created_at=datetime.now().strftime("%d.%m.%Y %H:%M"),
+            **vals,
+            created_at=format_timestamp(),
         )
         self.top.grab_release(); self.top.destroy()
         self.on_save(payload)
 
-    def _make_scroll_list(self, parent, *, row, column, columnspan=2, height=6, padx=8, pady=(0,8)):
-        """Створює Listbox із вертикальним Scrollbar у фіксованій висоті."""
+    def _make_scroll_list(self, parent, options=(), *, row, column, columnspan=2, height=6, padx=8, pady=(0,8)):
+        """
+        Створює Listbox із вертикальним Scrollbar у фіксованій висоті.
+        Варіанти живуть у listvariable: заміна списку — одне var.set(tuple(...)).
+        Повертає (listbox, var).
+        """
         wrap = tk.Frame(parent, bg=BLUE_BG)
         wrap.grid(row=row, column=column, columnspan=columnspan, sticky="nsew", padx=padx, pady=pady)
 
-        lb = tk.Listbox(wrap, height=height, exportselection=False)
+        var = tk.Variable(parent, value=tuple(options))
+        lb = tk.Listbox(wrap, height=height, exportselection=False, listvariable=var)
         lb.pack(side="left", fill="both", expand=True)
 
         sb = ttk.Scrollbar(wrap, orient="vertical", command=lb.yview)
         sb.pack(side="right", fill="y")
 
         lb.configure(yscrollcommand=sb.set)
-        return lb
+        return lb, var
@@ -1,7 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, colorchooser, messagebox
-from datetime import datetime
+from modules.helpers import format_timestamp
 from theme import BLUE_BG, BG_MAIN, RED_BG
+from modules.window_helpers import center_geometry
+from dialogs._style import ensure_ttk_ready
 
 class CreateVisualizationDialog:
     """
@@ -16,15 +18,14 @@ class CreateVisualizationDialog:
         self.names = forecast_names or []
 
         self.top = tk.Toplevel(master)
+        self.top.withdraw()  # показуємо один раз, уже на місці
+        ensure_ttk_ready(master)
         self.top.title("Створити візуалізацію")
-        self.top.transient(master); self.top.grab_set()
+        self.top.transient(master)
         self.top.configure(bg=BLUE_BG); self.top.resizable(False, False)
 
         w, h = 420, 220
-        self.top.update_idletasks()
-        x = master.winfo_x() + (master.winfo_width() - w) // 2
-        y = master.winfo_y() + (master.winfo_height() - h) // 2
-        self.top.geometry(f"{w}x{h}+{x}+{y}")
+        self.top.geometry(center_geometry(master, w, h))
 
         frm = tk.Frame(self.top, bg=BLUE_BG, bd=2, relief="groove")
         frm.pack(fill="both", expand=True, padx=16, pady=16)
@@ -34,21 +35,12 @@ class CreateVisualizationDialog:
         if self.names: self.cmb.current(0)
         self.cmb.grid(row=1, column=0, sticky="ew", pady=(0,8))
 
-        tk.Label(frm, text="Колір лінії моніторингу", bg=BLUE_BG).grid(row=2, column=0, sticky="w")
-        real_data_color_row = tk.Frame(frm, bg=BLUE_BG)
-        real_data_color_row.grid(row=3, column=0, sticky="w", pady=(0,8))
         self.real_data_color = "#1f77b4"
-        self.real_data_preview = tk.Canvas(real_data_color_row, width=28, height=18, bg=self.real_data_color, highlightthickness=1, highlightbackground="#888")
-        self.real_data_preview.pack(side="left", padx=(0,6))
-        ttk.Button(real_data_color_row, text="Обрати колір…", command=self._pick_real_data_color).pack(side="left")
-
-        tk.Label(frm, text="Колір лінії передбачення", bg=BLUE_BG).grid(row=4, column=0, sticky="w")
-        forecast_color_row = tk.Frame(frm, bg=BLUE_BG)
-        forecast_color_row.grid(row=5, column=0, sticky="w", pady=(0,8))
+        self.real_data_preview = self._color_row(frm, 2, "Колір лінії моніторингу",
+                                                 self.real_data_color, self._pick_real_data_color)
         self.forecast_color = "#BA1200"
-        self.forecast_preview = tk.Canvas(forecast_color_row, width=28, height=18, bg=self.forecast_color, highlightthickness=1, highlightbackground="#888")
-        self.forecast_preview.pack(side="left", padx=(0,6))
-        ttk.Button(forecast_color_row, text="Обрати колір…", command=self._pick_forecast_color).pack(side="left")
+        self.forecast_preview = self._color_row(frm, 4, "Колір лінії передбачення",
+                                                self.forecast_color, self._pick_forecast_color)
 
         actions = tk.Frame(frm, bg=BLUE_BG)
         actions.grid(row=5, column=0, sticky="e")
@@ -57,6 +49,19 @@ class CreateVisualizationDialog:
 
         frm.grid_columnconfigure(0, weight=1)
 
+        self.top.deiconify()
+        self.top.grab_set()
+
+    def _color_row(self, frm, row, title, color, command):
+        """Підпис у рядку row, під ним — зразок кольору й кнопка вибору. Повертає зразок."""
+        tk.Label(frm, text=title, bg=BLUE_BG).grid(row=row, column=0, sticky="w")
+        line = tk.Frame(frm, bg=BLUE_BG)
+        line.grid(row=row + 1, column=0, sticky="w", pady=(0,8))
+        preview = tk.Canvas(line, width=28, height=18, bg=color, highlightthickness=1, highlightbackground="#888")
+        preview.pack(side="left", padx=(0,6))
+        ttk.Button(line, text="Обрати колір…", command=command).pack(side="left")
+        return preview
+
     def _pick_real_data_color(self):
         self._pick('real_data')
 
@@ -65,9 +70,10 @@ class CreateVisualizationDialog:
 
     def _pick(self, element):
 
-        source = self.real_data_color if element == 'forecast' else self.forecast_color
+        source = self.real_data_color if element == 'real_data' else self.forecast_color
 
-        rgb, hx = colorchooser.askcolor(color=source, title="Колір лінії")
+        # parent — сам діалог: вибір кольору стає поверх нього й не конфліктує з його grab
+        rgb, hx = colorchooser.askcolor(color=source, title="Колір лінії", parent=self.top)
         if hx:
             if element == 'real_data':
                 self.real_data_color = hx
@@ -85,7 +91,7 @@ class CreateVisualizationDialog:
             "forecast_name": name,
             "real_data_color": self.real_data_color,
             "forecast_color": self.forecast_color,
-            "created_at": datetime.now().strftime("%d.%m.%Y %H:%M"),
+            "created_at": format_timestamp(),
         }
         self.top.grab_release(); self.top.destroy()
         self.on_save(payload)
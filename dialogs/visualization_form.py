@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from theme import BLUE_BG, BG_MAIN, RED_BG
+from modules.window_helpers import center_geometry
+from dialogs._style import ensure_ttk_ready
 
 class ChooseForecastDialog:
     """
@@ -15,16 +17,15 @@ class ChooseForecastDialog:
         self.names = forecast_names or []
 
         self.top = tk.Toplevel(master)
+        self.top.withdraw()  # показуємо один раз, уже на місці
+        ensure_ttk_ready(master)
         self.top.title("Передбачення")
-        self.top.transient(master); self.top.grab_set()
+        self.top.transient(master)
         self.top.configure(bg=BLUE_BG)
         self.top.resizable(False, False)
 
         w, h = 420, 320
-        self.top.update_idletasks()
-        x = master.winfo_x() + (master.winfo_width() - w) // 2
-        y = master.winfo_y() + (master.winfo_height() - h) // 2
-        self.top.geometry(f"{w}x{h}+{x}+{y}")
+        self.top.geometry(center_geometry(master, w, h))
 
         frm = tk.Frame(self.top, bg=BLUE_BG, bd=2, relief="groove")
         frm.pack(fill="both", expand=True, padx=16, pady=16)
@@ -43,6 +44,9 @@ class ChooseForecastDialog:
         tk.Button(actions, text="Зберегти", bg=BG_MAIN, command=self._save).pack(side="left", padx=(0,8))
         tk.Button(actions, text="Скасувати", bg=RED_BG, command=self.top.destroy).pack(side="left")
 
+        self.top.deiconify()
+        self.top.grab_set()
+
     def _save(self):
         if not self.listbox.curselection():
             messagebox.showwarning("Перевірка", "Оберіть передбачення.")
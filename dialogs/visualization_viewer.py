@@ -1,6 +1,9 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 from theme import BLUE_BG, BG_MAIN
+from modules.window_helpers import center_geometry
+from dialogs._style import ensure_ttk_ready
 
 from src.forecast import Forecast
 from modules.downloader import trigger_file_download
@@ -23,21 +26,28 @@ class VisualizationViewer:
             Forecast.getImagePath(forecast_title, 'comparison')
         ]
 
+        # відсутні файли видно одразу — без спроби PhotoImage і винятку з Tcl
+        self._exists = [bool(p) and os.path.isfile(p) for p in self.images]
+
         # кеш об'єктів PhotoImage, щоб GC не прибирав
         self._photos = [None, None, None]
+        # елементи заглушки створюються раз на слайд; ресайз лише рухає їх
+        self._ph_items = None
+        # один елемент-зображення на канві; слайди лише міняють йому image
+        self._image_id = None
+        self._resize_after = None
 
         # ---- Вікно
         self.top = tk.Toplevel(master)
+        self.top.withdraw()  # показуємо один раз, уже на місці
+        ensure_ttk_ready(master)
         self.top.title(forecast_title or "Візуалізація")
-        self.top.transient(master); self.top.grab_set()
+        self.top.transient(master)
         self.top.configure(bg=BLUE_BG)
         self.top.resizable(True, True)
 
         w, h = 900, 640
-        self.top.update_idletasks()
-        x = master.winfo_x() + (master.winfo_width() - w) // 2
-        y = master.winfo_y() + (master.winfo_height() - h) // 2
-        self.top.geometry(f"{w}x{h}+{x}+{y}")
+        self.top.geometry(center_geometry(master, w, h))
 
         root = tk.Frame(self.top, bg=BLUE_BG, bd=2, relief="groove")
         root.pack(fill="both", expand=True, padx=12, pady=12)
@@ -78,7 +88,12 @@ class VisualizationViewer:
         self._show_current()
 
         # також міняємо розмітку при resize, щоб не «різало» заглушку
-        self.top.bind("<Configure>", lambda e: self._refresh_scrollregion())
+        # <Configure> приходить від кожного віджета вікна й на кожен піксель ресайзу —
+        # заглушку підлаштовуємо раз, коли розмір 50 мс не змінюється
+        self.top.bind("<Configure>", self._on_configure)
+
+        self.top.deiconify()
+        self.top.grab_set()
 
     # ---------- slider API ----------
     '''
@@ -100,37 +115,65 @@ class VisualizationViewer:
     # ---------- rendering ----------
     def _show_current(self):
         self.idx_label.config(text=f"{self.index + 1} / {len(self.images)}")
-        self.canvas.delete("all")
 
         path = self.images[self.index]
-        if path:
+        if not self._exists[self.index]:
+            self._draw_placeholder("(Немає зображення)")
+            return
+        # PNG декодується лише при першому показі слайда, далі береться з кешу
+        img = self._photos[self.index]
+        if img is None:
             try:
                 # стандартний PhotoImage (PNG/GIF). Для JPG знадобиться PIL.
-                img = tk.PhotoImage(file=path)
-                self._photos[self.index] = img
-                # малюємо з верхнього лівого кута, щоб скролл працював інтуїтивно
-                self.canvas.create_image(0, 0, image=img, anchor="nw")
-                # область прокрутки рівна розміру зображення
-                self.canvas.config(scrollregion=(0, 0, img.width(), img.height()))
-                return
+                img = self._photos[self.index] = tk.PhotoImage(file=path)
             except Exception as e:
                 self._draw_placeholder(f"Не вдалося відкрити\n{path}\n{e}")
+                return
+        if self._image_id is None:
+            self.canvas.delete("all")
+            self._ph_items = None
+            # малюємо з верхнього лівого кута, щоб скролл працював інтуїтивно
+            self._image_id = self.canvas.create_image(0, 0, image=img, anchor="nw")
         else:
-            self._draw_placeholder("(Немає зображення)")
+            self.canvas.itemconfigure(self._image_id, image=img)
+        # область прокрутки рівна розміру зображення
+        self.canvas.config(scrollregion=(0, 0, img.width(), img.height()))
 
     def _draw_placeholder(self, text):
+        # заглушка вже на канві — лише міняємо текст
+        if self._ph_items is not None:
+            self.canvas.itemconfigure(self._ph_items[1], text=text)
+            self._place_placeholder()
+            return
         self.canvas.delete("all")
+        self._image_id = None
+        self._ph_items = (
+            self.canvas.create_rectangle(0, 0, 0, 0, outline="#c0c0c0"),
+            self.canvas.create_text(0, 0, text=text, fill="#888", anchor="center"),
+        )
+        self._place_placeholder()
+
+    def _place_placeholder(self):
         w = max(self.canvas.winfo_width(), 300)
         h = max(self.canvas.winfo_height(), 200)
         pad = 20
-        self.canvas.create_rectangle(pad, pad, w - pad, h - pad, outline="#c0c0c0")
-        self.canvas.create_text(w // 2, h // 2, text=text, fill="#888", anchor="center")
+        rect, text = self._ph_items
+        self.canvas.coords(rect, pad, pad, w - pad, h - pad)
+        self.canvas.coords(text, w // 2, h // 2)
         self.canvas.config(scrollregion=(0, 0, w, h))
 
+    def _on_configure(self, event):
+        if self._resize_after is not None:
+            self.top.after_cancel(self._resize_after)
+        self._resize_after = self.top.after(50, self._refresh_scrollregion)
+
     def _refresh_scrollregion(self):
-        # якщо показуємо зображення — scrollregion вже виставлено; для заглушки — підлаштуємо
-        if not any(self._photos):
-            self._draw_placeholder("(Немає зображення)")
+        self._resize_after = None
+        if not self.canvas.winfo_exists():
+            return
+        # якщо показуємо зображення — scrollregion вже виставлено; заглушку лише пересуваємо
+        if self._ph_items is not None:
+            self._place_placeholder()
 
     # ---------- scrolling helpers ----------
     def _on_mousewheel(self, event):
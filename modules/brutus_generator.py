@@ -4,13 +4,13 @@ import decimal
 import tkinter as tk
 import threading
 import os
+import numpy as np
 from tkinter import ttk, messagebox
 from tkinter import ttk, colorchooser, messagebox
 from datetime import datetime
 
 from dialogs.loading import LoadingWindow
-from modules.prophet_multivar import forecast_with_regressors
-from modules.helpers import smart_param_generator
+from modules.helpers import smart_param_generator, format_timestamp
 from src.forecast import Forecast
 from src.timeseries import Timeseries
 
@@ -26,7 +26,6 @@ class BrutusGenerator:
     
     def start(self):
 
-        self.lw.top.update_idletasks()
 
         target_params = {}
         variations = {}
@@ -137,13 +136,14 @@ class BrutusGenerator:
         print('Output - '+executions_path)
 
         self.lw.change_text(f"Прогрес: 0 / {max_combinations_count} комбінацій...")
-        self.lw.top.update_idletasks()
 
         #send forecast to another tread
         def worker():
             err = None
             result = None
             try:
+                # prophet/pandas вантажаться тут, у робочому потоці, а не при імпорті модуля
+                from modules.prophet_multivar import forecast_with_regressors
                 variation_index = 0
                 leaderboard = {}
                 max_leaders = 10
@@ -265,10 +265,7 @@ class BrutusGenerator:
                 err = e
             finally:
                 def finish():
-                    try:
-                        self.lw.top.destroy()
-                    except Exception:
-                        pass
+                    self.lw.close()
                     if err:
                         messagebox.showerror("Помилка", str(err), parent=self.container)
                     else:
@@ -305,10 +302,11 @@ class BrutusGenerator:
             d = decimal.Decimal(str(step))
             decimal_digits = abs(d.as_tuple().exponent)
 
-        item = min_val
-        while (item + step) <= max_val:
-            item += step
-            result.append(round(item, decimal_digits))
+        # усі кроки сітки одним масивом: min + k*step, без накопичення похибки в циклі
+        if step > 0:
+            n = int(np.floor((max_val - min_val) / step + 1e-9))
+            grid = min_val + step * np.arange(1, n + 1)
+            result.extend(np.round(grid, decimal_digits).tolist())
 
         if max_val not in result: result.append(max_val)
 
@@ -341,7 +339,7 @@ class BrutusGenerator:
             "changepoint_prior_scale": data['changepoint_prior_scale'],
             "seasonality_prior_scale": data['seasonality_prior_scale'],
             "regressor_global_importance": data['regressor_global_importance'],
-            "created_at": datetime.now().strftime("%d.%m.%Y %H:%M")
+            "created_at": format_timestamp()
         }
 
         return meta
\ No newline at end of file
@@ -23,21 +23,99 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Optional, Dict
+import io
 import json
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
 import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+try:
+    import orjson  # optional: faster data.json parsing
+except ImportError:
+    orjson = None
+
+# Long daily horizons: let Agg drop vertices that land on the same pixel and
+# stroke long paths in chunks. Applied via rc_context around a render only,
+# so matplotlib's global defaults stay untouched for other users.
+_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+# One off-screen Agg figure per plot kind, reused across renders. pyplot is not
+# used, so no interactive (Tk) backend is involved and worker threads never
+# touch Tk; the lock serialises renders that share the figures.
+_FIGS: Dict[str, tuple] = {}  # key -> (fig, ax)
+_FIG_LOCK = threading.Lock()
+
+
+def _blank_axes(key: str):
+    """
+    Return (fig, ax) for `key`, cleared for a new plot. The Axes is kept too:
+    ax.cla() resets its artists without rebuilding the Axes and its tickers.
+    """
+    pair = _FIGS.get(key)
+    if pair is None:
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        pair = _FIGS[key] = (fig, fig.add_subplot())
+    else:
+        pair[1].cla()
+    return pair
+
+
+def _release_axes() -> None:
+    """Drop the last render's lines so idle cached figures hold no series data."""
+    for _, ax in _FIGS.values():
+        ax.cla()
+
+
+# zlib level 1 instead of the default 6: compression dominated PNG writes for
+# these small line plots; files come out slightly larger
+_PNG_KW = {"dpi": 150, "pil_kwargs": {"compress_level": 1}}
+
+
+def _write_png(fig: Figure, outfile: Path) -> None:
+    """
+    Encode into memory, then swap the file in atomically: a viewer or the
+    images index never sees a half-written PNG.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", **_PNG_KW)
+    tmp = outfile.with_name(outfile.name + ".tmp")
+    tmp.write_bytes(buf.getbuffer())
+    os.replace(tmp, outfile)
+
+
+def _save_all(jobs) -> None:
+    """Rasterize and write finished (fig, outfile) pairs concurrently."""
+    with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="png") as ex:
+        futures = [ex.submit(_write_png, fig, outfile) for fig, outfile in jobs]
+        for f in futures:
+            f.result()  # re-raise the first failure
 
 
 # --------------------------- plotting helpers ---------------------------
 
 def _apply_monthly_ticks(ax) -> None:
     """Format x-axis with monthly major ticks and YYYY-MM labels."""
+    ax.xaxis_date()  # x is passed as float day numbers, see _date_x
     ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
 
 
+def _date_x(df: pd.DataFrame):
+    """`ds` as matplotlib day numbers, converted once in a single vectorised pass."""
+    return mdates.date2num(df["ds"].to_numpy())
+
+
 def _subtitle_for_item(item: dict) -> str:
     """Second line under the main title: regressors list if multivariate, else empty."""
     if item.get("kind") == "multivariate":
@@ -48,20 +126,18 @@ def _subtitle_for_item(item: dict) -> str:
 
 
 def _plot_line(
-    df: pd.DataFrame,
-    x: str,
-    y: str,
+    xs,
+    ys,
     title_main: str,
     title_sub: str,
-    outfile: Path,
-    xlim: tuple[pd.Timestamp, pd.Timestamp],
-    color: '#0000FF'
-) -> None:
-    """Single line plot with monthly ticks; optional second-line subtitle."""
-    fig = plt.figure()
-    ax = fig.gca()
-    if not df.empty:
-        line = ax.plot(df[x], df[y], label=title_main, color=color)
+    xlim: tuple[float, float],
+    color: '#0000FF',
+    fig_key: str,
+) -> Figure:
+    """Single line plot with monthly ticks; optional second-line subtitle. Not saved here."""
+    fig, ax = _blank_axes(fig_key)
+    if len(xs):
+        ax.plot(xs, ys, label=title_main, color=color)
 
     # Titles: first line minimal; second line (if any) with regressors
     ax.set_title(title_main + (f"\n{title_sub}" if title_sub else ""))
@@ -73,8 +149,7 @@ def _plot_line(
     _apply_monthly_ticks(ax)
     fig.autofmt_xdate()
     fig.tight_layout()
-    fig.savefig(outfile, dpi=150)
-    plt.close(fig)
+    return fig
 
 
 def _series_title(item: dict) -> str:
@@ -85,19 +160,6 @@ def _series_title(item: dict) -> str:
     return item.get("param", "series")
 
 
-def _file_suffix(item: dict) -> str:
-    base = item.get("target") if item.get("kind") == "multivariate" else item.get("param")
-    if item.get("kind") == "multivariate":
-        regs = item.get("regressors") or []
-        base = f"{base}__with_{'+'.join(regs)}" if regs else f"{base}__univariate"
-    parts = [base]
-    if item.get("station_code"):
-        parts.append(f"code={item['station_code']}")
-    if item.get("station_id"):
-        parts.append(f"id={item['station_id']}")
-    return "__".join(parts)
-
-
 def _pick_accuracy_metric(metrics: dict) -> tuple[str, dict]:
     """(Kept for return info; NOT displayed in titles anymore.)"""
     if not isinstance(metrics, dict) or not metrics:
@@ -155,7 +217,14 @@ def render_from_json(
     if not data_path.exists():
         raise FileNotFoundError(f"data.json not found at: {data_path}")
 
-    blob = json.loads(data_path.read_text(encoding="utf-8"))
+    blob = None
+    if orjson is not None:
+        try:
+            blob = orjson.loads(data_path.read_bytes())
+        except orjson.JSONDecodeError:
+            pass  # older data.json files may hold bare NaN, which only stdlib json accepts
+    if blob is None:
+        blob = json.loads(data_path.read_text(encoding="utf-8"))
     items = blob.get("items", [])
     if not items:
         raise ValueError("data.json contains no items")
@@ -197,37 +266,62 @@ def render_from_json(
     xlim = (x_min, x_max)
 
     # Output filenames
-    suffix = _file_suffix(chosen)
     fp_forecast = run_dir / f"forecast.png"
     fp_actuals = run_dir / f"actuals.png"
     fp_both = run_dir / f"actuals_vs_forecast.png"
 
     # Accuracy metric (kept only for return payload; not shown in titles)
-    metric_key, _ = _pick_accuracy_metric(chosen.get("metrics", {}))
+    metric_key, metric_payload = _pick_accuracy_metric(chosen.get("metrics", {}))
 
     # Titles (minimal + optional regressors on second line)
     subtitle = _subtitle_for_item(chosen)
 
     # Plots
-    _plot_line(
-        pred.rename(columns={"yhat": "y"}),
-        "ds", "y",
+    # the context covers both building the lines and the (joined) PNG writes
+    with _FIG_LOCK, matplotlib.rc_context(_RC):
+        try:
+            _render_plots(pred, act_plot, subtitle, metric_key, metric_payload, xlim,
+                          fp_forecast, fp_actuals, fp_both,
+                          real_data_color, forecast_color)
+        finally:
+            _release_axes()
+
+    return {
+        "kind": chosen.get("kind", "univariate"),
+        "metric_key": metric_key,
+        "forecast_png": str(fp_forecast.resolve()),
+        "actuals_png": str(fp_actuals.resolve()),
+        "both_png": str(fp_both.resolve()),
+        "run_dir": str(run_dir.resolve()),
+    }
+
+
+def _render_plots(pred, act_plot, subtitle, metric_key, metric_payload, xlim,
+                  fp_forecast, fp_actuals, fp_both,
+                  real_data_color, forecast_color) -> None:
+    """Build the three figures here, then write the PNGs in parallel."""
+    # x arrays are shared by the single plots and the overlay
+    pred_x = _date_x(pred)
+    xlim = tuple(mdates.date2num(pd.DatetimeIndex(xlim).to_numpy()))
+    act_x = _date_x(act_plot) if not act_plot.empty else ()
+    act_y = act_plot["y"].to_numpy() if not act_plot.empty else ()
+
+    fig_forecast = _plot_line(
+        pred_x, pred["yhat"].to_numpy(),
         "Forecast", subtitle,
-        fp_forecast, 
         xlim,
-        forecast_color
+        forecast_color,
+        "forecast",
     )
-    _plot_line(
-        act_plot,
-        "ds", "y",
+    fig_actuals = _plot_line(
+        act_x, act_y,
         "Actuals", '',
-        fp_actuals, 
         xlim,
-        real_data_color
+        real_data_color,
+        "actuals",
     )
 
     # ---- accuracy (from JSON) ----
-    metric_key, metric_payload = _pick_accuracy_metric(chosen.get("metrics", {}))
     acc_line = ""
     if metric_payload and (metric_payload.get("accuracy") is not None):
         try:
@@ -244,19 +338,18 @@ def render_from_json(
             acc_line = ""
 
     # ---- overlay plot ----
-    fig = plt.figure()
-    ax = fig.gca()
-    if not act_plot.empty:
-        ax.plot(act_plot["ds"], act_plot["y"], label="Actuals", color=real_data_color)
-    ax.plot(pred["ds"], pred["yhat"], label="Forecast", color=forecast_color)
+    fig, ax = _blank_axes("both")
+    if len(act_x):
+        ax.plot(act_x, act_y, label="Actuals", color=real_data_color)
+    ax.plot(pred_x, pred["yhat"].to_numpy(), label="Forecast", color=forecast_color)
     if {"yhat_lower", "yhat_upper"}.issubset(pred.columns):
         try:
-            ax.fill_between(pred["ds"], pred["yhat_lower"], pred["yhat_upper"], alpha=0.2, label="Uncertainty")
+            ax.fill_between(pred_x, pred["yhat_lower"].to_numpy(), pred["yhat_upper"].to_numpy(), alpha=0.2, label="Uncertainty",
+                            antialiased=False)  # translucent band: AA edges are not visible anyway
         except Exception:
             pass
 
     # title lines: 1) main, 2) regressors (if any), 3) accuracy (if any)
-    subtitle = _subtitle_for_item(chosen)
     title_lines = ["Actuals vs Forecast"]
     if subtitle:
         title_lines.append(subtitle)
@@ -272,14 +365,5 @@ def render_from_json(
     _apply_monthly_ticks(ax)
     fig.autofmt_xdate()
     fig.tight_layout()
-    fig.savefig(fp_both, dpi=150)
-    plt.close(fig)
 
-    return {
-        "kind": chosen.get("kind", "univariate"),
-        "metric_key": metric_key,
-        "forecast_png": str(fp_forecast.resolve()),
-        "actuals_png": str(fp_actuals.resolve()),
-        "both_png": str(fp_both.resolve()),
-        "run_dir": str(run_dir.resolve()),
-    }
+    _save_all([(fig_forecast, fp_forecast), (fig_actuals, fp_actuals), (fig, fp_both)])
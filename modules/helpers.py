@@ -1,6 +1,26 @@
 import random
+import time
+from datetime import datetime
+from functools import lru_cache
 from itertools import product
 
+TIMESTAMP_FORMAT = "%d.%m.%Y %H:%M"
+
+@lru_cache(maxsize=4)
+def _fmt_minute(stamp_min):
+    # те саме, що strftime(TIMESTAMP_FORMAT), але без розбору формату й локалі
+    t = datetime.fromtimestamp(stamp_min * 60)
+    return f"{t.day:02d}.{t.month:02d}.{t.year} {t.hour:02d}:{t.minute:02d}"
+
+def format_timestamp(dt=None):
+    """
+    Мітка часу з точністю до хвилини (за замовчуванням — поточна).
+    Значення кешується по номеру хвилини, тож серія викликів в межах
+    однієї хвилини форматує рядок лише раз.
+    """
+    stamp = time.time() if dt is None else dt.timestamp()
+    return _fmt_minute(int(stamp // 60))
+
 def smart_param_generator(space, n_main_samples=10000, n_regressor_sets=3):
     """
     Генерує розумні комбінації на основі випадкового пошуку + стохастичного вибору регресорів.
@@ -26,12 +26,24 @@ BASE_FORECASTS_DIR = (Path(__file__).resolve().parent.parent / "forecasts").reso
 def _parse_dt(x: Optional[object]) -> Optional[pd.Timestamp]:
     if x is None:
         return None
+    if isinstance(x, pd.Timestamp):
+        return x  # already parsed (callers pass frame min/max or pre-parsed bounds)
     dt = pd.to_datetime(x, errors="coerce")
     return None if pd.isna(dt) else dt
 
 def _apply_date_range(df: pd.DataFrame, start: Optional[object], end: Optional[object], col: str = "ds") -> pd.DataFrame:
     s = _parse_dt(start)
     e = _parse_dt(end)
+    if s is None and e is None:
+        return df
+    dates = df[col]
+    if pd.api.types.is_datetime64_dtype(dates) and dates.is_monotonic_increasing:
+        # sorted (the usual case: CSVs are read sorted by ds): two binary
+        # searches give the slice bounds, no boolean masks are materialised
+        arr = dates.to_numpy()
+        lo = arr.searchsorted(s.to_datetime64(), side="left") if s is not None else 0
+        hi = arr.searchsorted(e.to_datetime64(), side="right") if e is not None else len(arr)
+        return df.iloc[lo:hi]
     out = df
     if s is not None:
         out = out[out[col] >= s]
@@ -80,13 +92,8 @@ def _aggregate(df: pd.DataFrame, freq: str, how: str) -> pd.DataFrame:
     if how not in allowed:
         raise ValueError(f"agg must be one of {allowed}")
     s = df[["ds", "y"]].dropna().set_index("ds")["y"].resample(freq)
-    agg_map = {
-        "mean": s.mean(),
-        "median": s.median(),
-        "max": s.max(),
-        "min": s.min(),
-    }
-    out = agg_map[how].to_frame(name="y").reset_index()
+    # only the requested aggregation is computed
+    out = getattr(s, how)().to_frame(name="y").reset_index()
     return out.dropna()
 
 def _prepare_series(
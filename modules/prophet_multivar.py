@@ -27,6 +27,11 @@ import json
 import pandas as pd
 import numpy as np
 
+try:
+    import orjson  # optional: faster data.json serialization
+except ImportError:
+    orjson = None
+
 from prophet import Prophet
 
 # Reuse helpers/semantics from your existing univariate module
@@ -45,6 +50,28 @@ from modules.prophet_module import (
 
 # -------------------------- internal helpers --------------------------
 
+def _json_records(df: pd.DataFrame, cols: List[str]) -> List[dict]:
+    """
+    Rows of df[cols] as JSON-ready dicts, built column-wise:
+    'ds' (first column) as ISO strings, the rest as floats with NaN -> None.
+    Each column is converted once with tolist(); rows are only zipped together.
+    """
+    columns = [pd.to_datetime(df[cols[0]]).dt.strftime("%Y-%m-%dT%H:%M:%S").tolist()]
+    for col in cols[1:]:
+        vals = df[col].astype(float)
+        columns.append(vals.astype(object).where(vals.notna(), None).tolist())
+    return [dict(zip(cols, row)) for row in zip(*columns)]
+
+
+def _dump_blob(blob: dict) -> bytes:
+    """Serialize a data.json blob (UTF-8, indented)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(blob, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass  # anything orjson cannot encode goes through stdlib json, as before
+    return json.dumps(blob, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 def _prepare_param_series(
     timeseries_dir: Path | str,
@@ -247,6 +274,11 @@ def forecast_with_regressors(
     # Decide model grid
     mod_freq = model_freq or freq
 
+    # the training window is applied to the target and to every regressor —
+    # parse the bounds once here rather than on each _apply_date_range call
+    train_start = _parse_dt(train_start)
+    train_end = _parse_dt(train_end)
+
     # ---- bounds / logistic config ----
     use_bounds = (target_min is not None) or (target_max is not None)
     if use_bounds:
@@ -326,8 +358,10 @@ def forecast_with_regressors(
     # optional smoothing (history)
     if smooth_regressors and smooth_window > 1 and effective_regressors:
         train_df = train_df.sort_values("ds")
-        for r in effective_regressors:
-            train_df[r] = train_df[r].rolling(window=smooth_window, min_periods=1).mean()
+        # one rolling pass over all regressor columns (runs in pandas' compiled code)
+        train_df[effective_regressors] = (
+            train_df[effective_regressors].rolling(window=smooth_window, min_periods=1).mean()
+        )
 
     # ---- 2) forecast window on MODEL grid ----
     last_hist = train_df["ds"].max()
@@ -415,8 +449,9 @@ def forecast_with_regressors(
     # optional smoothing (future)
     if smooth_regressors and smooth_window > 1 and effective_regressors:
         future = future.sort_values("ds")
-        for r in effective_regressors:
-            future[r] = future[r].rolling(window=smooth_window, min_periods=1).mean()
+        future[effective_regressors] = (
+            future[effective_regressors].rolling(window=smooth_window, min_periods=1).mean()
+        )
 
     # NaN guard
     nan_cols = [r for r in effective_regressors if r not in future.columns or future[r].isna().any()]
@@ -502,8 +537,8 @@ def forecast_with_regressors(
                 "freq": freq,                 # OUTPUT grid
                 "model_freq": mod_freq,       # MODEL grid
                 "agg": agg, "growth": model_growth,
-                "train_start": str(pd.to_datetime(train_start)) if train_start else None,
-                "train_end": str(pd.to_datetime(train_end)) if train_end else None,
+                "train_start": str(train_start) if train_start is not None else None,
+                "train_end": str(train_end) if train_end is not None else None,
                 "fcst_start": str(pd.to_datetime(result_out["ds"].min())),
                 "fcst_end": str(pd.to_datetime(result_out["ds"].max())),
                 "bounds": {"min": target_min, "max": target_max} if use_bounds else None,
@@ -524,24 +559,15 @@ def forecast_with_regressors(
                 "regressor_future_prophet_disable_seasonality": regressor_future_prophet_disable_seasonality,
             },
             # save predictions on OUTPUT grid (daily if freq='D')
-            "predictions": [
-                {"ds": pd.to_datetime(r.ds).isoformat(),
-                 "yhat": float(r.yhat),
-                 "yhat_lower": float(r.yhat_lower),
-                 "yhat_upper": float(r.yhat_upper)}
-                for r in result_out.itertuples(index=False)
-            ],
+            "predictions": _json_records(result_out, ["ds", "yhat", "yhat_lower", "yhat_upper"]),
             # daily actuals for plotting
-            "actuals_daily": [
-                {"ds": pd.to_datetime(r.ds).isoformat(), "y": (None if pd.isna(r.y) else float(r.y))}
-                for r in actuals_daily.itertuples(index=False)
-            ],
+            "actuals_daily": _json_records(actuals_daily, ["ds", "y"]),
             # accuracy on MODEL grid
             "metrics": {
                 f"within_{int(accuracy_tolerance*100)}pct": acc_stats
             },
         })
-        data_path.write_text(json.dumps(blob, ensure_ascii=False, indent=2), encoding="utf-8")
+        data_path.write_bytes(_dump_blob(blob))
 
     # return OUTPUT-grid forecast
     return result_out
@@ -560,7 +586,7 @@ def _append_run_item_json(out_dir: Path, item: dict) -> Path:
     else:
         blob = {"items": []}
     blob["items"].append(item)
-    data_path.write_text(json.dumps(blob, ensure_ascii=False, indent=2), encoding="utf-8")
+    data_path.write_bytes(_dump_blob(blob))
     return data_path
 
 
@@ -585,12 +611,7 @@ def _build_daily_actuals(
         raise ValueError(f"agg must be one of {allowed}")
 
     s = df[["ds", "y"]].dropna().set_index("ds")["y"].resample("D")
-    daily = {
-        "mean": s.mean(),
-        "median": s.median(),
-        "max": s.max(),
-        "min": s.min(),
-    }[agg].to_frame("y")
+    daily = getattr(s, agg)().to_frame("y")
 
     # reindex to full daily grid
     idx = pd.date_range(start=start, end=end, freq="D")
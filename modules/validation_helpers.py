@@ -1,13 +1,23 @@
-from datetime import datetime
+import re
+from datetime import date
+from functools import lru_cache
 
+# строго YYYY-MM-DD; сам календар (31 лютого тощо) перевіряє date()
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+# форми перевіряють ті самі рядки при кожному збереженні — результати кешуються
+@lru_cache(maxsize=256)
 def validate_date(date_text):
+    m = _DATE_RE.fullmatch(date_text)
+    if m is None:
+        return False
     try:
-        if date_text != datetime.strptime(date_text, "%Y-%m-%d").strftime('%Y-%m-%d'):
-            raise ValueError
+        date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
         return True
     except ValueError:
         return False
 
+@lru_cache(maxsize=256)
 def string_is_number(str):
     try:
         float(str)
@@ -0,0 +1,20 @@
+import re
+
+_GEOMETRY_RE = re.compile(r"(\d+)x(\d+)\+?(-?\d+)\+?(-?\d+)")
+
+def center_geometry(master, w, h):
+    """
+    Рядок geometry ("WxH+X+Y") для вікна w×h по центру master.
+    Розмір і позиція master беруться одним викликом wm geometry
+    замість чотирьох winfo_*.
+    """
+    m = _GEOMETRY_RE.match(master.geometry())
+    if m is None:
+        return f"{w}x{h}"
+    mw, mh, mx, my = map(int, m.groups())
+    if mw <= 1 or mh <= 1:
+        # master ще не відображений (1x1+0+0) — центруємо по екрану
+        mw, mh, mx, my = master.winfo_screenwidth(), master.winfo_screenheight(), 0, 0
+    x = mx + (mw - w) // 2
+    y = my + (mh - h) // 2
+    return f"{w}x{h}+{x}+{y}"
@@ -2,6 +2,15 @@ import os
 import time
 import datetime
 import shutil
+from functools import lru_cache
+
+# пам'ять на перевірки існування файлів; tick у ключі (крок 2 с)
+# робить записи застарілими самі по собі
+_FILE_TICK = 2
+
+@lru_cache(maxsize=512)
+def _is_file(path, tick):
+    return os.path.isfile(path)
 
 class FileModel:
 
@@ -13,7 +22,19 @@ class FileModel:
 
     @classmethod
     def fileExists(cls, file_name):
-        return os.path.isfile(cls.fullPath(file_name))
+        return _is_file(cls.fullPath(file_name), int(time.time() // _FILE_TICK))
+
+    @classmethod
+    def clearCache(cls):
+        _is_file.cache_clear()
+
+    @classmethod
+    def dirKey(cls, path):
+        """mtime каталогу (нс) як ключ кешу; None, якщо каталогу немає."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
 
     @classmethod
     def getItems(cls):
@@ -3,6 +3,13 @@ import os
 
 from src.file_model import FileModel
 
+# тип зображення -> ім'я файлу в каталозі передбачення
+IMAGE_FILES = {
+    'actuals': 'actuals.png',
+    'forecast': 'forecast.png',
+    'comparison': 'actuals_vs_forecast.png',
+}
+
 class Forecast(FileModel):
 
     file_path = "forecasts"
@@ -29,18 +36,10 @@ class Forecast(FileModel):
 
     @classmethod
     def getImagePath(cls, forecast_name, type):
-        path = ''
-        forecast_path = cls.fullPath(forecast_name)
-
-        match type:
-            case 'actuals':
-                path = forecast_path+'/actuals.png'
-            case 'forecast':
-                path = forecast_path+'/forecast.png'
-            case 'comparison':
-                path = forecast_path+'/actuals_vs_forecast.png'
-
-        return path
+        file_name = IMAGE_FILES.get(type)
+        if file_name is None:
+            return ''
+        return cls.fullPath(forecast_name)+'/'+file_name
 
     @classmethod
     def hasImages(cls, forecast_name):
@@ -49,6 +48,26 @@ class Forecast(FileModel):
         else:
             return False
 
+    @classmethod
+    def imagesIndex(cls):
+        """Імена передбачень, у яких є всі три зображення — один прохід scandir."""
+        required = set(IMAGE_FILES.values())
+        result = set()
+        try:
+            entries = list(os.scandir(cls.file_path))
+        except OSError:
+            return result
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                names = {f.name for f in os.scandir(entry.path) if f.is_file()}
+            except OSError:
+                continue
+            if required <= names:
+                result.add(entry.name)
+        return result
+
     @classmethod
     def clearImages(cls, forecast_name):
         cls.safeDeleteFile(cls.getImagePath(forecast_name, 'actuals'))
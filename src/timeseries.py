@@ -6,37 +6,53 @@ class Timeseries(FileModel):
 
     file_path = 'timeseries'
 
+    # кеші перевіряються за mtime каталогу: поки вміст не змінився,
+    # повторне сканування диска не потрібне
     entries_cache = []
+    entries_cache_key = None
 
     @classmethod
     def getEntries(cls, force_update = False, only_names = False):
-        if cls.entries_cache == [] or force_update:
+        key = cls.dirKey(cls.file_path)
+        if force_update or key is None or key != cls.entries_cache_key:
             items = cls.getItems()
             cls.entries_cache = items['directories']
+            cls.entries_cache_key = key
 
         if only_names:
-            result = []
-            for entry in cls.entries_cache: result.append(entry['name'])
-            return result
+            return [entry['name'] for entry in cls.entries_cache]
         else:
             return cls.entries_cache
 
 
     params_cache = []
+    params_cache_key = None
 
     @classmethod
     def getParams(cls, force_update = False):
-        if cls.params_cache == [] or force_update:
-            entries = cls.getEntries()
-            if entries != []:
-                path_to_check = cls.file_path+'/'+entries[0]['name']
-                items = os.listdir(path_to_check)
+        entries = cls.getEntries()
+        if entries == []:
+            return []
 
-                for item in items:
-                    item_path = path_to_check+'/'+item
+        path_to_check = cls.file_path+'/'+entries[0]['name']
+        key = (path_to_check, cls.dirKey(path_to_check))
+        if force_update or key[1] is None or key != cls.params_cache_key:
+            params = []
+            for item in os.listdir(path_to_check):
+                item_path = path_to_check+'/'+item
 
-                    if os.path.isfile(item_path):
-                        item = item.replace('.csv', '')
-                        cls.params_cache.append(item)
+                if os.path.isfile(item_path):
+                    params.append(item.replace('.csv', ''))
 
-        return cls.params_cache
\ No newline at end of file
+            cls.params_cache = params
+            cls.params_cache_key = key
+
+        return cls.params_cache
+
+    @classmethod
+    def clearCache(cls):
+        super().clearCache()
+        cls.entries_cache = []
+        cls.entries_cache_key = None
+        cls.params_cache = []
+        cls.params_cache_key = None
@@ -1,8 +1,17 @@
 from __future__ import annotations
 import json
+import os
+import queue
+import threading
+import traceback
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    import orjson  # необов'язково: швидша серіалізація
+except ImportError:
+    orjson = None
+
 WORKSPACE = Path.cwd() / "workspace"
 STATE_FILE = WORKSPACE / "state.json"
 
@@ -13,6 +22,9 @@ DEFAULT_STATE = {
     "visualizations": []   # [{forecast_name, color, created_at}]
 }
 
+_write_lock = threading.Lock()
+_last_payload = None  # байти, які зараз лежать у state.json
+
 def ensure_workspace() -> None:
     WORKSPACE.mkdir(exist_ok=True)
 
@@ -20,9 +32,11 @@ def load_state() -> Dict[str, Any]:
     ensure_workspace()
     if not STATE_FILE.exists():
         return DEFAULT_STATE.copy()
+    global _last_payload
     try:
-        with STATE_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = STATE_FILE.read_bytes()
+        data = json.loads(raw)
+        _last_payload = raw
         # обережне злиття з дефолтом
         out = DEFAULT_STATE.copy()
         out.update({k: v for k, v in data.items() if k in DEFAULT_STATE})
@@ -31,7 +45,85 @@ def load_state() -> Dict[str, Any]:
         # якщо файл пошкоджений — стартуємо з порожнього
         return DEFAULT_STATE.copy()
 
+def _dumps(state: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(state)
+        except TypeError:
+            pass  # те, чого orjson не вміє (напр. нестрокові ключі), серіалізує json
+    return json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def write_state(state: Dict[str, Any]) -> None:
+    """
+    Атомарний запис: спершу тимчасовий файл (з fsync), потім os.replace,
+    тож обірваний запис не залишає пошкоджений state.json.
+    Якщо серіалізований стан збігається з уже записаним, запис пропускається.
+    """
+    _write_payload(_dumps(state))
+
+def _write_payload(payload: bytes) -> None:
+    global _last_payload
+    with _write_lock:
+        if payload == _last_payload:
+            return  # нічого не змінилось — файл не переписуємо
+        ensure_workspace()
+        tmp = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, STATE_FILE)
+        _last_payload = payload
+
+class _StateWriter(threading.Thread):
+    """
+    Єдиний фоновий потік запису стану. Черга на один елемент:
+    новий стан витісняє ще не записаний, тож пише лише найсвіжіший.
+    """
+    def __init__(self):
+        super().__init__(name="state-writer", daemon=True)
+        self.queue = queue.Queue(maxsize=1)
+
+    def submit(self, payload: bytes) -> None:
+        while True:
+            try:
+                self.queue.put_nowait(payload)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.queue.task_done()  # застарілий стан відкинуто
+                except queue.Empty:
+                    pass
+
+    def run(self) -> None:
+        while True:
+            payload = self.queue.get()
+            try:
+                _write_payload(payload)
+            except Exception:
+                # помилка диска: показуємо в консолі, наступне збереження спробує ще раз
+                traceback.print_exc()
+            finally:
+                self.queue.task_done()
+
+_writer = None
+_writer_lock = threading.Lock()
+
 def save_state(state: Dict[str, Any]) -> None:
-    ensure_workspace()
-    with STATE_FILE.open("w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
+    """
+    Серіалізує стан тут же, у Tk-потоці (знімок, який потім уже не зміниться,
+    а помилка серіалізації видна викликачу), і ставить байти в чергу запису.
+    """
+    global _writer
+    payload = _dumps(state)
+    with _writer_lock:
+        if _writer is None:
+            _writer = _StateWriter()
+            _writer.start()
+    _writer.submit(payload)
+
+def flush_state() -> None:
+    """Чекає, доки фоновий потік допише все, що стоїть у черзі."""
+    if _writer is not None:
+        _writer.queue.join()
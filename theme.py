@@ -17,3 +17,16 @@ def init_styles():
     style.configure("List.TFrame", background=BG_PANEL)
     style.configure("Item.TLabel", background=BG_PANEL, foreground="#333")
     style.configure("TButton", padding=6)
+
+    # рядки списків: кольори задаються стилем, а не опціями кожного віджета
+    style.configure("Row.TFrame", background=BG_PANEL)
+    style.configure("Name.TLabel", background="white", foreground="#000",
+                    borderwidth=1, relief="solid", padding=(4, 2))
+    style.configure("Delete.TButton", background=RED_BG, foreground="#8a0f0f", borderwidth=1, padding=(2, 1))
+    style.map("Delete.TButton", background=[("active", RED_BG)])
+    style.configure("Edit.TButton", background=YELLOW_BG, foreground="#6b4b00", borderwidth=1, padding=(2, 1))
+    style.map("Edit.TButton", background=[("active", YELLOW_BG)])
+
+    # кнопки лівої навігації
+    style.configure("Nav.TButton", background=BLUE_BG, relief="groove", borderwidth=2, padding=(14, 10))
+    style.map("Nav.TButton", background=[("active", BLUE_BG)])
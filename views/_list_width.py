@@ -0,0 +1,29 @@
+class ListWidthMixin:
+    """
+    Ширина вкладеного у канву списку = ширина канви.
+    Нащадок має self.canvas і після create_window викликає _bind_list_width(win_id).
+    """
+    def _bind_list_width(self, win_id):
+        self._list_win_id = win_id
+        self._list_w = 0
+        self._resize_after = None
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+
+    def destroy(self):
+        # відкладений ресайз не повинен спрацювати після знищення екрана
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+            self._resize_after = None
+        super().destroy()
+
+    def _on_canvas_configure(self, event):
+        # проміжні події ресайзу відкидаються
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+        self._resize_after = self.after(30, self._apply_list_width, event.width)
+
+    def _apply_list_width(self, width):
+        self._resize_after = None
+        if abs(width - self._list_w) > 2:
+            self._list_w = width
+            self.canvas.itemconfigure(self._list_win_id, width=width)
@@ -0,0 +1,255 @@
+import tkinter as tk
+from abc import ABCMeta, abstractmethod
+from functools import partial
+from itertools import count
+from tkinter import ttk
+from theme import BG_PANEL, PURPLE_BG
+from modules.helpers import format_timestamp
+
+class BaseListView(ttk.Frame, metaclass=ABCMeta):
+    """
+    Спільний каркас екрана зі списком рядків.
+    Список віртуалізований: віджети існують лише для рядків, що потрапляють
+    у видиму область канви (пул перевикористовуваних рядків), а самі дані
+    зберігаються у self.rows як звичайні dict з ключем "iid"
+    (rows_by_iid — швидкий доступ за ним).
+    Нащадки реалізують:
+    - _create_row(slot): створити віджети рядка у slot["frame"]
+    - _fill_row(slot, record): показати запис у віджетах слота
+    """
+    title = ""
+
+    WHEEL_TAG = "BaseListViewWheel"
+    _wheel_bound = False
+
+    ROW_H = 44   # висота рядка разом із вертикальними відступами
+    ROW_PAD = 6
+    PAD_X = 24
+    TOP = 6
+
+    def __init__(self, master, on_add_click, on_rows_changed=None):
+        super().__init__(master, style="BaseView.TFrame")
+        self.on_add_click = on_add_click
+        self.on_rows_changed = on_rows_changed or (lambda: None)
+        self.rows = []          # [dict] — лише дані, без віджетів, у порядку показу
+        self.rows_by_iid = {}   # iid -> dict; видалені записи сюди не потрапляють
+        self._iids = count(1)
+        self._pool = []  # [{frame, win_id, record, iid, ...}]
+        self._compact_after = None
+        self._refresh_after = None
+        self._row_w = 0
+        self._canvas_w = self._canvas_h = 1
+
+        ttk.Label(self, text=self.title, style="Head.TLabel").pack(anchor="n", pady=(18, 8))
+
+        columns = tk.Frame(self, bg=BG_PANEL)
+        columns.pack(fill="both", expand=True)
+        columns.grid_columnconfigure(0, minsize=70)
+        columns.grid_columnconfigure(1, weight=1)
+        columns.grid_rowconfigure(0, weight=1)
+
+        tk.Button(columns, text="＋", font=("", 16, "bold"),
+                  width=3, height=1, bg=PURPLE_BG, fg="#3f3356",
+                  relief="raised", bd=1, command=self.on_add_click)\
+          .grid(row=0, column=0, sticky="n", padx=(18, 8), pady=(24, 0))
+
+        list_container = tk.Frame(columns, bg=BG_PANEL)
+        list_container.grid(row=0, column=1, sticky="nsew", padx=(0, 24), pady=(8, 24))
+        list_container.grid_rowconfigure(0, weight=1)
+        list_container.grid_columnconfigure(0, weight=1)
+
+        self.canvas = tk.Canvas(list_container, bg=BG_PANEL, highlightthickness=0,
+                                yscrollincrement=self.ROW_H)
+        self.vsb = ttk.Scrollbar(list_container, orient="vertical", command=self.canvas.yview)
+        # канва повідомляє про кожну зміну видимої області — тоді й перекладаємо пул
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.vsb.grid(row=0, column=1, sticky="ns")
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+
+        # колесо миші: одна прив'язка на клас для всіх списків, рядки лише
+        # отримують тег, тож прокрутка працює і над кнопками рядків
+        if not BaseListView._wheel_bound:
+            root = self._root()
+            for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                root.bind_class(self.WHEEL_TAG, seq, BaseListView._on_wheel)
+            BaseListView._wheel_bound = True
+        self._add_wheel_tag(self.canvas)
+
+    def destroy(self):
+        # відкладені after_idle-колбеки посилаються на Tcl-команди віджета;
+        # скасовуємо їх, щоб вони не спрацювали (і не висіли) після знищення
+        for attr in ("_refresh_after", "_compact_after"):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                self.after_cancel(after_id)
+                setattr(self, attr, None)
+        super().destroy()
+
+    # ---- hooks ----
+    @abstractmethod
+    def _create_row(self, slot):
+        """Створює віджети рядка у slot["frame"] (раз на слот пулу)."""
+
+    @abstractmethod
+    def _fill_row(self, slot, record):
+        """Показує record у віджетах слота."""
+
+    # ---- API ----
+    def bulk_add(self, records):
+        """Додає одразу багато записів: один _refresh і один on_rows_changed на всю пачку."""
+        for record in records:
+            self._add_record(record)
+        self._schedule_refresh()
+        self.on_rows_changed()
+
+    # ---- internals ----
+    def _add_record(self, record):
+        record["iid"] = str(next(self._iids))
+        self.rows.append(record)
+        self.rows_by_iid[record["iid"]] = record
+        return record["iid"]
+
+    def _append_row(self, record):
+        iid = self._add_record(record)
+        self._schedule_refresh()
+        self.on_rows_changed()
+        return iid
+
+    def _clear_rows(self):
+        self.rows = []
+        self.rows_by_iid = {}
+
+    def _timestamp(self, dt=None):
+        return format_timestamp(dt)
+
+    def _on_remove(self, record):
+        """Хук: побічні дії видалення запису (файли тощо)."""
+        pass
+
+    def _remove_row(self, iid):
+        # запис лише зникає з rows_by_iid; сам список ущільнюється
+        # один раз на idle-такт, хоч би скільки рядків прибрали поспіль
+        record = self.rows_by_iid.pop(iid, None)
+        if record is None:
+            return
+        self._on_remove(record)
+        if self._compact_after is None:
+            self._compact_after = self.after_idle(self._compact_rows)
+
+    def _compact_rows(self):
+        self._compact_after = None
+        self.rows = [it for it in self.rows if it["iid"] in self.rows_by_iid]
+        self._refresh()
+        self.on_rows_changed()
+
+    def _slot_command(self, slot, action):
+        """
+        Команда кнопки слота: діє на запис, який слот показує зараз.
+        Реєструється один раз при створенні слота і не змінюється при прокрутці.
+        """
+        return partial(self._dispatch_slot, slot, action)
+
+    def _dispatch_slot(self, slot, action):
+        if slot["iid"] is not None:
+            action(slot["iid"])
+
+    def _refill(self, record):
+        """Перемальовує запис, якщо він зараз видимий."""
+        for slot in self._pool:
+            if slot["record"] is record:
+                self._fill_row(slot, record)
+                break
+
+    def _add_wheel_tag(self, widget):
+        widget.bindtags((self.WHEEL_TAG,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+
+    @staticmethod
+    def _on_wheel(event):
+        view = event.widget
+        while view is not None and not isinstance(view, BaseListView):
+            view = getattr(view, "master", None)
+        if view is None:
+            return
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        view.canvas.yview_scroll(step, "units")
+        return "break"
+
+    def _on_canvas_configure(self, event):
+        # розмір беремо з події; серія подій ресайзу дає один _refresh
+        self._canvas_w, self._canvas_h = event.width, event.height
+        self._schedule_refresh()
+
+    def _row_width(self):
+        return max(self._canvas_w - 2 * self.PAD_X, 1)
+
+    def _new_slot(self):
+        frame = ttk.Frame(self.canvas, style="Row.TFrame")
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(0, weight=1)
+        slot = {"frame": frame, "record": None, "iid": None}
+        self._create_row(slot)
+        self._add_wheel_tag(frame)
+        slot["win_id"] = self.canvas.create_window(
+            self.PAD_X, 0, window=frame, anchor="nw",
+            width=self._row_w, height=self.ROW_H - 2 * self.ROW_PAD,
+            state="hidden"
+        )
+        return slot
+
+    def _schedule_refresh(self):
+        # серія add_row до наступного idle-такту дає один _refresh
+        if self._refresh_after is None:
+            self._refresh_after = self.after_idle(self._refresh)
+
+    def _refresh(self):
+        """Оновлює область прокрутки та перерозкладає видимі рядки."""
+        if self._refresh_after is not None:
+            self.after_cancel(self._refresh_after)
+            self._refresh_after = None
+        width = self._row_width()
+        if width != self._row_w:
+            self._row_w = width
+            for slot in self._pool:
+                self.canvas.itemconfigure(slot["win_id"], width=width)
+        height = 2 * self.TOP + len(self.rows) * self.ROW_H
+        self.canvas.configure(scrollregion=(0, 0, width + 2 * self.PAD_X, height))
+        self._layout_visible()
+
+    def _on_yscroll(self, first, last):
+        self.vsb.set(first, last)
+        self._layout_visible()
+
+    def _visible_range(self):
+        top = self.canvas.canvasy(0)
+        height = max(self._canvas_h, self.ROW_H)
+        first = max(0, int((top - self.TOP) // self.ROW_H))
+        last = min(len(self.rows), int((top + height - self.TOP) // self.ROW_H) + 1)
+        return first, last
+
+    def _layout_visible(self):
+        first, last = self._visible_range()
+        while len(self._pool) < last - first:
+            self._pool.append(self._new_slot())
+
+        for i, slot in enumerate(self._pool):
+            idx = first + i
+            if idx < last:
+                record = self.rows[idx]
+                y = self.TOP + idx * self.ROW_H + self.ROW_PAD
+                self.canvas.coords(slot["win_id"], self.PAD_X, y)
+                self.canvas.itemconfigure(slot["win_id"], state="normal")
+                if slot["record"] is not record:
+                    slot["record"] = record
+                    slot["iid"] = record["iid"]
+                    self._fill_row(slot, record)
+            elif slot["record"] is not None:
+                self.canvas.itemconfigure(slot["win_id"], state="hidden")
+                slot["record"] = slot["iid"] = None
@@ -1,13 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from theme import BG_PANEL, RED_BG, PURPLE_BG, YELLOW_BG
+from theme import BG_PANEL, PURPLE_BG
 from pathlib import Path
 import shutil, threading, os
+from functools import partial
+from itertools import count
 
 from src.forecast import Forecast
+from views._list_width import ListWidthMixin
 from modules.downloader import trigger_file_download
 
-class ForecastsView(ttk.Frame):
+class ForecastsView(ListWidthMixin, ttk.Frame):
     """
     Екран 'Передбачення'.
     - on_add_click: викликається кнопкою ＋
@@ -19,7 +22,9 @@ class ForecastsView(ttk.Frame):
         super().__init__(master, style="BaseView.TFrame")
         self.on_add_click = on_add_click
         self.on_rows_changed = on_rows_changed or (lambda: None)
-        self.rows = []    # [{row, data_dict}]
+        self.rows = []    # [{uid, row, data_dict}]
+        self.rows_by_uid = {}
+        self._uids = count(1)
         self.row_idx = 0
         self.models_view = models_view
         self.visualization_view = visualization_view
@@ -45,23 +50,35 @@ class ForecastsView(ttk.Frame):
         self.vsb = ttk.Scrollbar(list_container, orient="vertical", command=self.canvas.yview)
         self.list_frame = ttk.Frame(self.canvas, style="List.TFrame")
         self.list_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self._canvas_win_id = self.canvas.create_window((0, 0), window=self.list_frame, anchor="nw", width=1)
+        win_id = self.canvas.create_window((0, 0), window=self.list_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.vsb.set)
 
         self.canvas.grid(row=0, column=0, sticky="nsew")
         self.vsb.grid(row=0, column=1, sticky="ns")
-        self.canvas.bind("<Configure>", lambda e: self.canvas.itemconfigure(self._canvas_win_id, width=self.canvas.winfo_width()))
+        self._bind_list_width(win_id)
 
         tk.Frame(self.list_frame, bg=BG_PANEL, height=6).grid(row=0, column=0, sticky="ew")
         self.list_frame.grid_columnconfigure(0, weight=1)
 
     # ---- API ----
     def add_row(self, data: dict):
+        self._build_row(data)
+        self.on_rows_changed()
+
+    def bulk_add(self, items):
+        """Пакетне додавання: один on_rows_changed на всю пачку."""
+        for data in items:
+            self._build_row(data)
+        self.on_rows_changed()
+
+    def _build_row(self, data: dict):
         """
         data = {name, prob, model, forecast_from, forecast_to, created_at}
         """
+        uid = next(self._uids)
+
         # Рядок списку: 2 колонки — [білий контейнер][кнопка ✖]
-        row = tk.Frame(self.list_frame, bg=BG_PANEL)
+        row = ttk.Frame(self.list_frame, style="Row.TFrame")
         row.grid(row=self.row_idx + 1, column=0, sticky="ew", pady=6, padx=(24, 24))
         row.grid_columnconfigure(0, weight=1)  # контейнер розтягується
         row.grid_columnconfigure(1, weight=0)
@@ -94,55 +111,55 @@ class ForecastsView(ttk.Frame):
 
         ttk.Label(row, text=data.get("created_at",""), style="Item.TLabel").grid(row=0, column=1, padx=10)
 
-        download_btn = tk.Button(
-            row, text="⤓", width=3, bg=YELLOW_BG, fg="#8a0f0f",
-            bd=1, relief="raised", command=lambda r=row: self._download_data(r)
+        download_btn = ttk.Button(
+            row, text="⤓", width=3, style="Edit.TButton", command=partial(self._download_data, uid)
         )
         download_btn.grid(row=0, column=2, padx=(0, 6))  # прилягає справа до картки
 
-        del_btn = tk.Button(
-            row, text="✖", width=3, bg=RED_BG, fg="#8a0f0f",
-            bd=1, relief="raised", command=lambda r=row: self._remove_row(r)
+        del_btn = ttk.Button(
+            row, text="✖", width=3, style="Delete.TButton", command=partial(self._remove_row, uid)
         )
         del_btn.grid(row=0, column=3)
 
         # Зберігаємо
-        self.rows.append({"row": row, "data": dict(data)})
+        item = {"uid": uid, "row": row, "data": dict(data)}
+        self.rows.append(item)
+        self.rows_by_uid[uid] = item
         self.row_idx += 1
-        self.on_rows_changed()
 
 
     def export_state(self):
         return [it["data"] for it in self.rows]
 
+    def get_names(self):
+        # лише імена, без копій даних рядків; rows_by_uid зберігає порядок додавання
+        return [it["data"].get("name", "") for it in self.rows_by_uid.values()]
+
     def import_state(self, items):
         for it in list(self.rows):
             it["row"].destroy()
-        self.rows.clear(); self.row_idx = 0
-        for obj in items or []:
-            self.add_row(obj)
-        self.on_rows_changed()
+        self.rows.clear(); self.rows_by_uid.clear(); self.row_idx = 0
+        self.bulk_add(items or [])
 
     # ---- internals ----
-    def _remove_row(self, row_widget):
-        for i, it in enumerate(self.rows):
-            if it["row"] is row_widget:
-                it["row"].destroy(); 
-                self.rows.pop(i); 
-                Forecast.deleteItem(it['data'].get('name'))
-                self.visualization_view.remove_forecast_row(it['data'].get('name'))
-                break
+    def _remove_row(self, uid):
+        it = self.rows_by_uid.pop(uid, None)
+        if it is None:
+            return
+        it["row"].destroy()
+        self.rows.remove(it)
+        Forecast.deleteItem(it['data'].get('name'))
+        self.visualization_view.remove_forecast_row(it['data'].get('name'))
         for idx, it in enumerate(self.rows, start=1):
             it["row"].grid_configure(row=idx)
         self.row_idx = len(self.rows)
         self.on_rows_changed()
 
-    def _download_data(self, row_widget):
-        for i, it in enumerate(self.rows):
-            if it["row"] is row_widget:
-                file_path = Forecast.getDataFilePath(it['data'].get('name'))
-                trigger_file_download(file_path, self)
-                break
+    def _download_data(self, uid):
+        it = self.rows_by_uid.get(uid)
+        if it is not None:
+            file_path = Forecast.getDataFilePath(it['data'].get('name'))
+            trigger_file_download(file_path, self)
 
     def find_forecast_by_name(self, search_name):
         result = {}
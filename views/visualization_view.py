@@ -1,10 +1,13 @@
 import tkinter as tk
 from tkinter import ttk
-from theme import BG_PANEL, PURPLE_BG, RED_BG
+from functools import partial
+from itertools import count
+from theme import BG_PANEL, PURPLE_BG
 
 from src.forecast import Forecast
+from views._list_width import ListWidthMixin
 
-class VisualizationsView(ttk.Frame):
+class VisualizationsView(ListWidthMixin, ttk.Frame):
     """
     Екран 'Візуалізація' як список карток.
     - on_add_click(): відкрити модалку створення
@@ -18,7 +21,9 @@ class VisualizationsView(ttk.Frame):
         self.on_add_click = on_add_click
         self.on_view_click = on_view_click
         self.on_rows_changed = on_rows_changed or (lambda: None)
-        self.rows = []   # [{row, data}]; data: {forecast_name, color, created_at}
+        self.rows = []   # [{uid, row, data}]; data: {forecast_name, color, created_at}
+        self.rows_by_uid = {}
+        self._uids = count(1)
 
         ttk.Label(self, text=self.title, style="Head.TLabel").pack(anchor="n", pady=(18, 8))
 
@@ -42,9 +47,9 @@ class VisualizationsView(ttk.Frame):
         self.vsb = ttk.Scrollbar(list_container, orient="vertical", command=self.canvas.yview)
         self.list_frame = ttk.Frame(self.canvas, style="List.TFrame")
         self.list_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self._win_id = self.canvas.create_window((0, 0), window=self.list_frame, anchor="nw", width=1)
+        win_id = self.canvas.create_window((0, 0), window=self.list_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.vsb.set)
-        self.canvas.bind("<Configure>", lambda e: self.canvas.itemconfigure(self._win_id, width=self.canvas.winfo_width()))
+        self._bind_list_width(win_id)
         self.canvas.grid(row=0, column=0, sticky="nsew")
         self.vsb.grid(row=0, column=1, sticky="ns")
 
@@ -53,10 +58,21 @@ class VisualizationsView(ttk.Frame):
 
     # ---- API ----
     def add_row(self, viz: dict):
+        self._build_row(viz)
+        self.on_rows_changed()
+
+    def bulk_add(self, items):
+        """Пакетне додавання: один on_rows_changed на всю пачку."""
+        for viz in items:
+            self._build_row(viz)
+        self.on_rows_changed()
+
+    def _build_row(self, viz: dict):
         """
         viz = {forecast_name:str, color:str('#RRGGBB'), created_at:str}
         """
-        row = tk.Frame(self.list_frame, bg=BG_PANEL)
+        uid = next(self._uids)
+        row = ttk.Frame(self.list_frame, style="Row.TFrame")
         row.grid(row=len(self.rows) + 1, column=0, sticky="ew", pady=6, padx=(24, 24))
         self.list_frame.grid_columnconfigure(0, weight=1)
         row.grid_columnconfigure(0, weight=1)  # картка тягнеться
@@ -81,13 +97,14 @@ class VisualizationsView(ttk.Frame):
 
         ttk.Label(row, text=viz.get("created_at",""), style="Item.TLabel").grid(row=0, column=1, padx=12)
 
-        tk.Button(row, text="👁", width=3, bg="#FFE6CC", bd=1, relief="raised",
-                  command=lambda d=viz: self.on_view_click(d)).grid(row=0, column=2, padx=(8,6))
-        tk.Button(row, text="✖", width=3, bg=RED_BG, fg="#8a0f0f", bd=1, relief="raised",
-                  command=lambda r=row: self._remove_row(r)).grid(row=0, column=3)
+        ttk.Button(row, text="👁", width=3, style="Edit.TButton",
+                  command=partial(self._view_row, uid)).grid(row=0, column=2, padx=(8,6))
+        ttk.Button(row, text="✖", width=3, style="Delete.TButton",
+                  command=partial(self._remove_row, uid)).grid(row=0, column=3)
 
-        self.rows.append({"row": row, "data": dict(viz)})
-        self.on_rows_changed()
+        item = {"uid": uid, "row": row, "data": dict(viz)}
+        self.rows.append(item)
+        self.rows_by_uid[uid] = item
 
     def export_state(self):
         return [it["data"] for it in self.rows]
@@ -96,23 +113,28 @@ class VisualizationsView(ttk.Frame):
         for it in list(self.rows):
             it["row"].destroy()
         self.rows.clear()
-        for obj in items or []:
-            self.add_row(obj)
+        self.rows_by_uid.clear()
+        self.bulk_add(items or [])
 
     def remove_forecast_row(self, forecast_name):
         for i, it in enumerate(self.rows):
             if it['data']['forecast_name'] == forecast_name:
-                self._remove_row(it['row'])
+                self._remove_row(it['uid'])
                 break
 
     # ---- internals ----
-    def _remove_row(self, row_widget):
-        for i, it in enumerate(self.rows):
-            if it["row"] is row_widget:
-                Forecast.clearImages(it['data']['forecast_name'])
-                it["row"].destroy()
-                self.rows.pop(i)
-                break
+    def _view_row(self, uid):
+        it = self.rows_by_uid.get(uid)
+        if it is not None:
+            self.on_view_click(it["data"])
+
+    def _remove_row(self, uid):
+        it = self.rows_by_uid.pop(uid, None)
+        if it is None:
+            return
+        Forecast.clearImages(it['data']['forecast_name'])
+        it["row"].destroy()
+        self.rows.remove(it)
         for idx, it in enumerate(self.rows, start=1):
             it["row"].grid_configure(row=idx)
         self.on_rows_changed()